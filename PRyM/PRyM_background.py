@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+import warnings
+import numpy as np
+from scipy.interpolate import CubicSpline
+import PRyM.PRyM_init as PRyMini
+
+# Bump whenever the layout of serialized backgrounds changes
+bckg_version = 1
+
+##########################################
+# Continuous background thermodynamics #
+##########################################
+# Temperatures [MeV] as functions of time [s]: cubic splines of ln(T) in ln(t) on a knot set
+# refined until they reproduce a continuous solution (e.g. ODE dense output) within tol.
+# Columns of T_knots: [Tg,Tnu(,TNP)]
+class Background(object):
+    def __init__(self,t_knots,T_knots,tol=0.):
+        self.lnt = np.log(np.asarray(t_knots,dtype=float))
+        self.lnT = np.log(np.atleast_2d(np.asarray(T_knots,dtype=float)))
+        self.tol = tol
+        self.t_ini, self.t_fin = np.exp(self.lnt[0]), np.exp(self.lnt[-1])
+        self.T_spline = CubicSpline(self.lnt,self.lnT,axis=1)
+        # Tg decreases with t: inverse relation and other temperatures as functions of Tg
+        self.lnt_spline = CubicSpline(self.lnT[0,::-1],self.lnt[::-1])
+        self.lnT_of_lnTg = CubicSpline(self.lnT[0,::-1],self.lnT[1:,::-1],axis=1)
+        self.a_of_T = None
+
+    @classmethod
+    def Adaptive(cls,T_of_t,t_ini,t_fin,tol,n_init=64,max_iter=30):
+        # Knots in ln(t), bisected where ln(T) and the inverse t(Tg) differ from T_of_t by more than tol
+        # at the interval midpoint (vectorized T_of_t: array of times --> array (n_cols,len(t)))
+        lnt = np.linspace(np.log(t_ini),np.log(t_fin),n_init)
+        for i in range(max_iter):
+            t_knots = np.exp(lnt)
+            t_knots[0], t_knots[-1] = t_ini, t_fin
+            bckg = cls(t_knots,T_of_t(t_knots))
+            lnt_mid = 0.5*(lnt[1:]+lnt[:-1])
+            err = bckg.Error(lnt_mid,np.log(T_of_t(np.exp(lnt_mid))))
+            bad = err > tol
+            if not np.any(bad):
+                break
+            lnt = np.sort(np.concatenate((lnt,lnt_mid[bad])))
+        bckg.tol = np.max(err)
+        if bckg.tol > tol:
+            warnings.warn("Background interpolation error %.1e above tolerance %.1e after %d refinements (%d knots)." % (bckg.tol,tol,max_iter,len(bckg.lnt)))
+        return bckg
+
+    def Error(self,lnt,lnT):
+        # Largest relative error of T(t), t(Tg) and T(Tg) on the columns of lnT at times lnt
+        err = np.abs(self.T_spline(lnt)-lnT).max(axis=0)
+        err = np.maximum(err,np.abs(self.lnt_spline(lnT[0])-lnt))
+        return np.maximum(err,np.abs(self.lnT_of_lnTg(lnT[0])-lnT[1:]).max(axis=0))
+
+    # Temperatures [MeV] at t [s]
+    def Tg(self,t):
+        return np.exp(self.T_spline(np.log(t))[0])
+    def Tnu(self,t):
+        return np.exp(self.T_spline(np.log(t))[1])
+    def TNP(self,t):
+        return np.exp(self.T_spline(np.log(t))[2])
+    # Time [s] and other temperatures [MeV] at photon temperature T [MeV]
+    def t_of_T(self,T):
+        return np.exp(self.lnt_spline(np.log(T)))
+    def Tnu_of_T(self,T):
+        return np.exp(self.lnT_of_lnTg(np.log(T))[0])
+    def TNP_of_T(self,T):
+        return np.exp(self.lnT_of_lnTg(np.log(T))[1])
+    # Logarithmic derivative dln(Tg)/dln(t)
+    def dlnTgdlnt(self,t):
+        return self.T_spline(np.log(t),1)[0]
+
+    # Scale factor: relation a(T) provided by the caller (entropy conservation)
+    def SetScaleFactor(self,a_of_T):
+        self.a_of_T = a_of_T
+    def a_of_t(self,t):
+        return self.a_of_T(self.Tg(t))
+
+    def Sample(self,n):
+        # n log-spaced times from t_ini to t_fin, with temperatures: [t_vec,Tg_vec,Tnu_vec(,TNP_vec)]
+        t_vec = np.logspace(np.log10(self.t_ini),np.log10(self.t_fin),n)
+        t_vec[0], t_vec[-1] = self.t_ini, self.t_fin
+        return [t_vec]+list(np.exp(self.T_spline(np.log(t_vec))))
+
+    # Compact binary form: header [version,n_cols,n_knots,tol], then ln(t) and ln(T) knots (float64)
+    def ToBytes(self):
+        header = np.array([bckg_version,self.lnT.shape[0],len(self.lnt),self.tol],dtype=np.float64)
+        return header.tobytes()+self.lnt.tobytes()+self.lnT.tobytes()
+
+    @classmethod
+    def FromBytes(cls,blob):
+        data = np.frombuffer(blob,dtype=np.float64)
+        version, n_cols, n_knots, tol = data[:4]
+        if(version != bckg_version or len(data) != 4+int(n_knots)*(1+int(n_cols))):
+            raise ValueError("Background blob of unknown layout.")
+        lnt = data[4:4+int(n_knots)]
+        lnT = data[4+int(n_knots):].reshape(int(n_cols),int(n_knots))
+        return cls(np.exp(lnt),np.exp(lnT),tol)
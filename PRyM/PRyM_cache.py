@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+import os
+import hashlib
+import numpy as np
+import PRyM.PRyM_init as PRyMini
+import PRyM.PRyM_background as PRyMbckg
+
+my_dir = PRyMini.working_dir
+cache_dir = my_dir+"/PRyMrates/thermo/cache/"
+# Bump whenever the content or the meaning of cached arrays changes
+cache_version = 1
+
+# Inputs of the background thermodynamics (besides NP callables)
+bckg_inputs = ["me","GF","geL","geR","gmuL","gmuR","Mpl","MeV_to_secm1","MeV_to_Kelvin",
+               "DeltaNeff","T_start","t_end","n_sampling","coarse_bckg_flag","n_sampling_coarse","smooth_bckg_flag",
+               "dense_bckg_flag","bckg_interp_tol","aTid_flag","tab_eos_flag","numba_flag","julia_flag","bckg_method",
+               "NP_thermo_flag","Tstart_NP","NP_nu_flag","NP_e_flag"]
+# Input thermo tables (fnu, QED, e+- EOS): size and modification time in the key
+# (not Tgamma_Tnu*.txt, output of save_bckg_flag rewritten at every run)
+thermo_dir = my_dir+"/PRyMrates/thermo/"
+thermo_tables = ["nue_scatt.txt","numu_scatt.txt","nue_ann.txt","numu_ann.txt",
+                 "QED_P_int.txt","QED_dP_intdT.txt","QED_d2P_intdT2.txt","e_EOS_tab.txt"]
+# Probe temperatures [MeV] for the fingerprint of NP callables
+T_probe = [10.,3.,1.,0.5,0.1,0.01]
+
+def FunctionFingerprint(f,nargs):
+    # Bytecode and constants, plus sampled values to catch closures and globals
+    if not callable(f):
+        return repr(f)
+    code = getattr(f,"__code__",None)
+    res = "" if code is None else code.co_code.hex()+repr(code.co_consts)
+    for T in T_probe:
+        try:
+            res += repr(float(f(*([T]*nargs))))
+        except Exception as err:
+            res += type(err).__name__
+    return res
+
+def TableStamps():
+    stamps = []
+    for name in thermo_tables:
+        if not os.path.isfile(thermo_dir+name): # e+- EOS table built on first use
+            continue
+        stat = os.stat(thermo_dir+name)
+        stamps.append("%s:%d:%d" % (name,stat.st_size,stat.st_mtime_ns))
+    return stamps
+
+def BackgroundKey(PRyMthermo):
+    # Hash of every input the background thermodynamics depends on
+    key = [repr(cache_version)]
+    # Tstart_NP: set by the user for NP species only
+    key += [name+"="+repr(getattr(PRyMini,name,None)) for name in bckg_inputs]
+    key += TableStamps()
+    if(PRyMini.NP_thermo_flag or PRyMini.NP_nu_flag or PRyMini.NP_e_flag):
+        key.append(FunctionFingerprint(PRyMthermo.rho_NP,1))
+        key.append(FunctionFingerprint(PRyMthermo.p_NP,1))
+        key.append(FunctionFingerprint(PRyMthermo.drho_NP_dT,1))
+        key.append(FunctionFingerprint(PRyMthermo.delta_rho_NP,4))
+    return hashlib.sha1("\n".join(key).encode()).hexdigest()
+
+def LoadBackground(key):
+    # Returns [t_vec,Tg_vec,Tnu_vec(,TNP_vec)] or None if not cached
+    try:
+        with np.load(cache_dir+key+".npz") as data:
+            return [data[name] for name in data.files]
+    except (OSError,ValueError):
+        return None
+
+def SaveBackground(key,arrays):
+    os.makedirs(cache_dir,exist_ok=True)
+    names = ["t_vec","Tg_vec","Tnu_vec","TNP_vec"][:len(arrays)]
+    # Write to temporary file first: safe with several runs in parallel
+    tmp_file = cache_dir+key+".%d.tmp.npz" % os.getpid()
+    np.savez(tmp_file,**dict(zip(names,arrays)))
+    os.replace(tmp_file,cache_dir+key+".npz")
+
+def LoadBackgroundObject(key):
+    # Returns the continuous background (see PRyM_background.py) or None if not cached
+    try:
+        with open(cache_dir+key+".bckg","rb") as f:
+            return PRyMbckg.Background.FromBytes(f.read())
+    except (OSError,ValueError):
+        return None
+
+def SaveBackgroundObject(key,bckg):
+    os.makedirs(cache_dir,exist_ok=True)
+    tmp_file = cache_dir+key+".%d.tmp.bckg" % os.getpid()
+    with open(tmp_file,"wb") as f:
+        f.write(bckg.ToBytes())
+    os.replace(tmp_file,cache_dir+key+".bckg")
@@ -4,6 +4,7 @@ from scipy.special import gamma, spence
 from scipy.integrate import quad
 from scipy.interpolate import interp1d
 import PRyM.PRyM_init as PRyMini
+import PRyM.PRyM_tables as PRyMtables
 if(PRyMini.compute_nTOp_thermal_flag):
     import vegas
 
@@ -630,8 +631,8 @@ def ComputeWeakRates(Tvec):
         if(PRyMini.verbose_flag):
             print("n <--> p thermal corrections computed")
     else:
-        T_nTOp_thermal_interval, L_nTOpCCRTh_res = np.loadtxt(my_dir+"/PRyMrates/nTOp/"+"nTOp_thermal_corrections.txt", unpack = True)
-        T_nTOp_thermal_interval, L_pTOnCCRTh_res = np.loadtxt(my_dir+"/PRyMrates/nTOp/"+"pTOn_thermal_corrections.txt", unpack = True)
+        T_nTOp_thermal_interval, L_nTOpCCRTh_res = PRyMtables.LoadTable(my_dir+"/PRyMrates/nTOp/"+"nTOp_thermal_corrections.txt", unpack = True)
+        T_nTOp_thermal_interval, L_pTOnCCRTh_res = PRyMtables.LoadTable(my_dir+"/PRyMrates/nTOp/"+"pTOn_thermal_corrections.txt", unpack = True)
     ################################
     # Splining thermal corrections #
     ################################
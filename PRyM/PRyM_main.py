@@ -2,7 +2,7 @@
 import time
 import numpy as np
 from scipy.integrate import solve_ivp
-from scipy.interpolate import interp1d
+from scipy.interpolate import interp1d, CubicSpline
 from scipy.special import zeta
 
 class PRyMclass(object):
@@ -11,11 +11,13 @@ class PRyMclass(object):
         # PRyMordial initialization #
         #############################
         import PRyM.PRyM_init as PRyMini
+        import PRyM.PRyM_tables as PRyMtables
         if(PRyMini.julia_flag):
             from julia import Main
             from diffeqpy import de
             import PRyM.PRyM_jl_sys as PRyMjl
         import PRyM.PRyM_thermo as PRyMthermo
+        import PRyM.PRyM_background as PRyMbckg
         # Loading New Physics species (constructor default: none)
         PRyMthermo.rho_NP,PRyMthermo.p_NP,PRyMthermo.drho_NP_dT,PRyMthermo.delta_rho_NP=my_rho_NP,my_p_NP,my_drho_NP_dT,my_delta_rho_NP
     
@@ -36,6 +38,8 @@ class PRyMclass(object):
         ##############################
         Tstart_MeV = PRyMini.T_start/PRyMini.MeV_to_Kelvin
         Tend_MeV = PRyMini.T_end/PRyMini.MeV_to_Kelvin
+        # Number of background samples (coarser grid only with smooth interpolants)
+        n_bckg = PRyMini.n_sampling_coarse if (PRyMini.coarse_bckg_flag and PRyMini.smooth_bckg_flag) else PRyMini.n_sampling
 
         ##################
         # Thermodynamics #
@@ -46,7 +50,8 @@ class PRyMclass(object):
 
         # Expansion rate from Friedmann equation
         def Hubble(Tg,Tnue,Tnumu,T_NP=0.):
-            rho_pl = PRyMthermo.rho_g(Tg)+PRyMthermo.rho_e(Tg)-PRyMthermo.PofT(Tg)+Tg*PRyMthermo.dPdT(Tg)
+            P_T, dPdT_T = PRyMthermo.QED_interp(Tg)[:2]
+            rho_pl = PRyMthermo.rho_g(Tg)+PRyMthermo.rho_e(Tg)-P_T+Tg*dPdT_T
             rho_3nu = PRyMthermo.rho_nu(Tnue)+2.*PRyMthermo.rho_nu(Tnumu)
             rho_tot = rho_pl+rho_3nu
             if(PRyMini.NP_thermo_flag):
@@ -56,14 +61,34 @@ class PRyMclass(object):
             if(PRyMini.NP_e_flag):
                 rho_tot += PRyMthermo.rho_NP(Tg)
             return PRyMini.MeV_to_secm1*(rho_tot*8.*np.pi/(3.*PRyMini.Mpl**2))**0.5
+        # Looking up the background in the cache (if computed before with same inputs)
+        # Continuous background (dense output of the solver), if dense_bckg_flag
+        bckg = None
+        bckg_cached = None
+        if(PRyMini.compute_bckg_flag and PRyMini.cache_bckg_flag):
+            import PRyM.PRyM_cache as PRyMcache
+            bckg_key = PRyMcache.BackgroundKey(PRyMthermo)
+            if(PRyMini.dense_bckg_flag):
+                bckg = PRyMcache.LoadBackgroundObject(bckg_key)
+                bckg_cached = None if bckg is None else bckg.Sample(n_bckg)
+            else:
+                bckg_cached = PRyMcache.LoadBackground(bckg_key)
+            if(PRyMini.verbose_flag and bckg_cached is not None):
+                print("Background thermodynamics loaded from cache.")
+        if(bckg_cached is not None):
+            if(PRyMini.NP_thermo_flag):
+                t_vec,Tg_vec,Tnu_vec,TNP_vec = bckg_cached
+            else:
+                t_vec,Tg_vec,Tnu_vec = bckg_cached
         # Computing the background (if not pre-stored)
-        if(PRyMini.compute_bckg_flag):
+        elif(PRyMini.compute_bckg_flag):
             # Integrated Boltzmann equations for temperature of species
             # Neutrino temperature evolution
             def dTnudt(Tg,Tnue,Tnumu,T_NP=0.):
                 Hubble_T = Hubble(Tg,Tnue,Tnumu,T_NP)
                 num = -12.*Hubble_T*PRyMthermo.rho_nu(Tnue)
-                delta_rho_nu = (PRyMthermo.delta_rho_nue(Tg,Tnue,Tnumu)+2.*PRyMthermo.delta_rho_numu(Tg,Tnue,Tnumu))
+                delta_rho_nue, delta_rho_numu = PRyMthermo.delta_rho_nu_all(Tg,Tnue,Tnumu)
+                delta_rho_nu = delta_rho_nue+2.*delta_rho_numu
                 if(PRyMini.NP_thermo_flag):
                     delta_rho_nu += PRyMthermo.delta_rho_NP(Tg,Tnue,Tnumu,T_NP)
                 num += delta_rho_nu
@@ -75,13 +100,15 @@ class PRyMclass(object):
             # Plasma temperature evolution
             def dTgdt(Tg,Tnue,Tnumu,T_NP=0.):
                 Hubble_T = Hubble(Tg,Tnue,Tnumu,T_NP)
-                num = -(Hubble_T*(4.*PRyMthermo.rho_g(Tg)+3.*(PRyMthermo.rho_e(Tg)+PRyMthermo.p_e(Tg))+3.*Tg*PRyMthermo.dPdT(Tg)))
+                QED_T = PRyMthermo.QED_interp(Tg)
+                num = -(Hubble_T*(4.*PRyMthermo.rho_g(Tg)+3.*(PRyMthermo.rho_e(Tg)+PRyMthermo.p_e(Tg))+3.*Tg*QED_T[1]))
                 # Sum of collision terms must vanish
-                delta_rho_g = -(PRyMthermo.delta_rho_nue(Tg,Tnue,Tnumu)+2.*PRyMthermo.delta_rho_numu(Tg,Tnue,Tnumu))
+                delta_rho_nue, delta_rho_numu = PRyMthermo.delta_rho_nu_all(Tg,Tnue,Tnumu)
+                delta_rho_g = -(delta_rho_nue+2.*delta_rho_numu)
                 if(PRyMini.NP_thermo_flag):
                     delta_rho_g -= PRyMthermo.delta_rho_NP(Tg,Tnue,Tnumu,T_NP) # traceless collision operator
                 num += delta_rho_g
-                den = PRyMthermo.drho_g_dT(Tg)+PRyMthermo.drho_e_dT(Tg)+Tg*PRyMthermo.d2PdT2(Tg)
+                den = PRyMthermo.drho_g_dT(Tg)+PRyMthermo.drho_e_dT(Tg)+Tg*QED_T[2]
                 if(PRyMini.NP_e_flag):
                     num -= 3.*Hubble_T*(PRyMthermo.rho_NP(Tg)+PRyMthermo.p_NP(Tg))
                     den += PRyMthermo.drho_NP_dT(Tg)
@@ -105,11 +132,25 @@ class PRyMclass(object):
                     Tg,Tnu = T_vec
                     y_vec = dTgdt(Tg,Tnu,Tnu),dTnudt(Tg,Tnu,Tnu)
                     return y_vec
+            # Compiled kernel from tabulated inputs for SM species (NP species, or T_start above the
+            # e+- EOS table, i.e. Tg > 511 MeV: Python path above with quad fallback)
+            if(PRyMini.numba_flag and PRyMini.tab_eos_flag and not (PRyMini.NP_thermo_flag or PRyMini.NP_nu_flag or PRyMini.NP_e_flag)
+               and PRyMini.T_start/PRyMini.MeV_to_Kelvin < PRyMini.me/PRyMthermo.x_EOS_min):
+                kernel_args = (PRyMthermo.BackgroundConsts(),PRyMthermo.EOS_coeffs,PRyMthermo.lnx_EOS_0,PRyMthermo.dlnx_EOS,PRyMthermo.QED_interp.args,PRyMthermo.fnu_interp.args)
+                def dTgdt(Tg,Tnue,Tnumu,T_NP=0.):
+                    return PRyMthermo.dTdt_SM_kernel(Tg,Tnue,*kernel_args)[0]
+                def dTnudt(Tg,Tnue,Tnumu,T_NP=0.):
+                    return PRyMthermo.dTdt_SM_kernel(Tg,Tnue,*kernel_args)[1]
+                def dTtotdt(t,T_vec):
+                    return PRyMthermo.dTdt_SM_kernel(T_vec[0],T_vec[1],*kernel_args)
+            # Jacobian of SM equations above (Tnue = Tnumu = Tnu), see PRyM_thermo.py
+            def dTtotdt_jac(t,T_vec):
+                return PRyMthermo.dTdt_SM_jac(T_vec[0],T_vec[1])
             # Solution of Boltzmann equations for background thermodynamics
             tfin = PRyMini.t_end # [s]
             if(PRyMini.NP_thermo_flag):
                 tini = 1./(2.*Hubble(Tstart_MeV,Tstart_MeV,Tstart_MeV,PRyMini.Tstart_NP)) # [s]
-                sol_thermo_sampling = np.logspace(np.log10(tini),np.log10(tfin),PRyMini.n_sampling)
+                sol_thermo_sampling = np.logspace(np.log10(tini),np.log10(tfin),n_bckg)
                 sol_thermo_sampling[0],sol_thermo_sampling[-1] = tini,tfin
                 Tini_vec = [Tstart_MeV,Tstart_MeV,PRyMini.Tstart_NP]
                 if(PRyMini.julia_flag):
@@ -117,21 +158,28 @@ class PRyMclass(object):
                     tspan = (np.float64(tini),np.float64(tfin))
                     p0 = [lambda w,x,y,z: np.float64(dTgdt(w,x,y,z)),lambda w,x,y,z: np.float64(dTnudt(w,x,y,z)),lambda w,x,y,z: np.float64(dTNPdt(w,x,y,z))]
                     prob = de.ODEProblem(PRyMjl.dTtotdtNPjl,T0,tspan,p0)
-                    sol_thermo = de.solve(prob,de.Tsit5(),saveat=sol_thermo_sampling,reltol=1.e-6,abstol=1.e-9)
-                    t_vec = sol_thermo.t
-                    sol_thermo = np.array(sol_thermo.u)
-                    Tg_vec = sol_thermo[:,0]
-                    Tnu_vec = sol_thermo[:,1]
-                    TNP_vec = sol_thermo[:,2]
+                    if(PRyMini.dense_bckg_flag):
+                        sol_thermo = de.solve(prob,de.Tsit5(),reltol=1.e-6,abstol=1.e-9)
+                        bckg = PRyMbckg.Background.Adaptive(lambda t: np.array([sol_thermo(x) for x in t]).T,tini,tfin,PRyMini.bckg_interp_tol)
+                    else:
+                        sol_thermo = de.solve(prob,de.Tsit5(),saveat=sol_thermo_sampling,reltol=1.e-6,abstol=1.e-9)
+                        t_vec = sol_thermo.t
+                        sol_thermo = np.array(sol_thermo.u)
+                        Tg_vec = sol_thermo[:,0]
+                        Tnu_vec = sol_thermo[:,1]
+                        TNP_vec = sol_thermo[:,2]
+                elif(PRyMini.dense_bckg_flag):
+                    sol_thermo = solve_ivp(dTtotdt,[tini,tfin],Tini_vec,method=PRyMini.bckg_method,dense_output=True,rtol=1.e-6,atol=1.e-9)
+                    bckg = PRyMbckg.Background.Adaptive(sol_thermo.sol,tini,tfin,PRyMini.bckg_interp_tol)
                 else:
-                    sol_thermo = solve_ivp(dTtotdt,[tini,tfin],Tini_vec,t_eval=sol_thermo_sampling,method='LSODA',rtol=1.e-6,atol=1.e-9)
+                    sol_thermo = solve_ivp(dTtotdt,[tini,tfin],Tini_vec,t_eval=sol_thermo_sampling,method=PRyMini.bckg_method,rtol=1.e-6,atol=1.e-9)
                     t_vec = sol_thermo.t
                     Tg_vec = sol_thermo.y[0][:]
                     Tnu_vec = sol_thermo.y[1][:]
                     TNP_vec = sol_thermo.y[2][:]
             else:
                 tini = 1./(2.*Hubble(Tstart_MeV,Tstart_MeV,Tstart_MeV)) # s
-                sol_thermo_sampling = np.logspace(np.log10(tini),np.log10(tfin),PRyMini.n_sampling)
+                sol_thermo_sampling = np.logspace(np.log10(tini),np.log10(tfin),n_bckg)
                 sol_thermo_sampling[0],sol_thermo_sampling[-1] = tini,tfin
                 Tini_vec = [Tstart_MeV,Tstart_MeV]
                 if(PRyMini.julia_flag):
@@ -139,33 +187,66 @@ class PRyMclass(object):
                     tspan = (np.float64(tini),np.float64(tfin))
                     p0 = [lambda x,y,z: np.float64(dTgdt(x,y,z)),lambda x,y,z: np.float64(dTnudt(x,y,z))]
                     prob = de.ODEProblem(PRyMjl.dTtotdtSMjl,T0,tspan,p0)
-                    sol_thermo = de.solve(prob,de.Tsit5(),saveat=sol_thermo_sampling,reltol=1.e-6,abstol=1.e-9)
-                    t_vec = sol_thermo.t
-                    sol_thermo = np.array(sol_thermo.u)
-                    Tg_vec = sol_thermo[:,0]
-                    Tnu_vec = sol_thermo[:,1]
+                    if(PRyMini.dense_bckg_flag):
+                        sol_thermo = de.solve(prob,de.Tsit5(),reltol=1.e-6,abstol=1.e-9)
+                        bckg = PRyMbckg.Background.Adaptive(lambda t: np.array([sol_thermo(x) for x in t]).T,tini,tfin,PRyMini.bckg_interp_tol)
+                    else:
+                        sol_thermo = de.solve(prob,de.Tsit5(),saveat=sol_thermo_sampling,reltol=1.e-6,abstol=1.e-9)
+                        t_vec = sol_thermo.t
+                        sol_thermo = np.array(sol_thermo.u)
+                        Tg_vec = sol_thermo[:,0]
+                        Tnu_vec = sol_thermo[:,1]
                 else:
-                    sol_thermo = solve_ivp(dTtotdt,[tini,tfin],Tini_vec,t_eval=sol_thermo_sampling,method='LSODA',rtol=1.e-6,atol=1.e-9)
-                    t_vec = sol_thermo.t
-                    Tg_vec = sol_thermo.y[0][:]
-                    Tnu_vec = sol_thermo.y[1][:]
+                    # Jacobian valid for SM species only (NP contributions left to the solver)
+                    jac_thermo = None if (PRyMini.NP_nu_flag or PRyMini.NP_e_flag) else dTtotdt_jac
+                    if(PRyMini.dense_bckg_flag):
+                        sol_thermo = solve_ivp(dTtotdt,[tini,tfin],Tini_vec,method=PRyMini.bckg_method,jac=jac_thermo,dense_output=True,rtol=1.e-6,atol=1.e-9)
+                        bckg = PRyMbckg.Background.Adaptive(sol_thermo.sol,tini,tfin,PRyMini.bckg_interp_tol)
+                    else:
+                        sol_thermo = solve_ivp(dTtotdt,[tini,tfin],Tini_vec,t_eval=sol_thermo_sampling,method=PRyMini.bckg_method,jac=jac_thermo,rtol=1.e-6,atol=1.e-9)
+                        t_vec = sol_thermo.t
+                        Tg_vec = sol_thermo.y[0][:]
+                        Tnu_vec = sol_thermo.y[1][:]
+            # Samples of the continuous background on the same grid as t_eval/saveat
+            if(bckg is not None):
+                if(PRyMini.NP_thermo_flag):
+                    t_vec,Tg_vec,Tnu_vec,TNP_vec = bckg.Sample(n_bckg)
+                else:
+                    t_vec,Tg_vec,Tnu_vec = bckg.Sample(n_bckg)
             # Save results for background thermodynamics
             if(PRyMini.save_bckg_flag):
                 if(PRyMini.NP_thermo_flag):
                     np.savetxt(my_dir+"/PRyMrates/"+"thermo/Tgamma_Tnu_TNP.txt",np.c_[t_vec,Tg_vec,Tnu_vec,TNP_vec])
                 else:
                     np.savetxt(my_dir+"/PRyMrates/"+"thermo/Tgamma_Tnu.txt",np.c_[t_vec,Tg_vec,Tnu_vec])
+            # Store results in the cache for subsequent runs
+            if(PRyMini.cache_bckg_flag and bckg is not None):
+                PRyMcache.SaveBackgroundObject(bckg_key,bckg)
+            elif(PRyMini.cache_bckg_flag):
+                if(PRyMini.NP_thermo_flag):
+                    PRyMcache.SaveBackground(bckg_key,[t_vec,Tg_vec,Tnu_vec,TNP_vec])
+                else:
+                    PRyMcache.SaveBackground(bckg_key,[t_vec,Tg_vec,Tnu_vec])
         else:
             if(PRyMini.NP_thermo_flag):
-                t_vec,Tg_vec,Tnu_vec,TNP_vec = np.loadtxt(my_dir+"/PRyMrates/"+"thermo/Tgamma_Tnu_TNP.txt",unpack=True)
+                t_vec,Tg_vec,Tnu_vec,TNP_vec = PRyMtables.LoadTable(my_dir+"/PRyMrates/"+"thermo/Tgamma_Tnu_TNP.txt",unpack=True)
             else:
-                t_vec,Tg_vec,Tnu_vec = np.loadtxt(my_dir+"/PRyMrates/"+"thermo/Tgamma_Tnu.txt",unpack=True)
+                t_vec,Tg_vec,Tnu_vec = PRyMtables.LoadTable(my_dir+"/PRyMrates/"+"thermo/Tgamma_Tnu.txt",unpack=True)
                 
         # Interpolation of Tnu(T) (and NP) for non-instantaneous decoupling effecs in a(T)
         if(PRyMini.aTid_flag):
-            TnuofT = interp1d(Tg_vec[:],Tnu_vec[:],bounds_error=False,fill_value="extrapolate",kind='linear')
-            if(PRyMini.NP_thermo_flag):
-                TNPofT = interp1d(Tg_vec[:],TNP_vec[:],bounds_error=False,fill_value="extrapolate",kind='linear')
+            if(bckg is not None):
+                TnuofT = bckg.Tnu_of_T
+                if(PRyMini.NP_thermo_flag):
+                    TNPofT = bckg.TNP_of_T
+            elif(PRyMini.smooth_bckg_flag):
+                TnuofT = PRyMthermo.LogLogSpline(Tg_vec[::-1],Tnu_vec[::-1])
+                if(PRyMini.NP_thermo_flag):
+                    TNPofT = PRyMthermo.LogLogSpline(Tg_vec[::-1],TNP_vec[::-1])
+            else:
+                TnuofT = interp1d(Tg_vec[:],Tnu_vec[:],bounds_error=False,fill_value="extrapolate",kind='linear')
+                if(PRyMini.NP_thermo_flag):
+                    TNPofT = interp1d(Tg_vec[:],TNP_vec[:],bounds_error=False,fill_value="extrapolate",kind='linear')
         
         ################
         # N effective  #
@@ -200,9 +281,16 @@ class PRyMclass(object):
         # FRW cosmological backround in radiation domination #
         ######################################################
         # Relation between time and temperature of the thermal bath
-        t_of_T = interp1d(Tg_vec[:],t_vec[:],bounds_error=False,fill_value="extrapolate",kind='linear')
+        if(bckg is not None):
+            t_of_T = bckg.t_of_T
+            T_of_t = bckg.Tg
+        elif(PRyMini.smooth_bckg_flag):
+            t_of_T = PRyMthermo.LogLogSpline(Tg_vec[::-1],t_vec[::-1])
+            T_of_t = PRyMthermo.LogLogSpline(t_vec,Tg_vec)
+        else:
+            t_of_T = interp1d(Tg_vec[:],t_vec[:],bounds_error=False,fill_value="extrapolate",kind='linear')
+            T_of_t = interp1d(t_vec[:],Tg_vec[:],bounds_error=False,fill_value="extrapolate",kind='linear')
         t_of_T_vec = np.vectorize(t_of_T)
-        T_of_t = interp1d(t_vec[:],Tg_vec[:],bounds_error=False,fill_value="extrapolate",kind='linear')
         T_of_t_vec = np.vectorize(T_of_t)
         
         ######################################################
@@ -213,7 +301,8 @@ class PRyMclass(object):
             # Heat rate due to neutrino (and NP) interactions with the plasma
             def N_nu_rate(T):
                 Tnu = TnuofT(T)
-                qdot_pl = -(PRyMthermo.delta_rho_nue(T,Tnu,Tnu)+2.*PRyMthermo.delta_rho_numu(T,Tnu,Tnu))
+                delta_rho_nue, delta_rho_numu = PRyMthermo.delta_rho_nu_all(T,Tnu,Tnu)
+                qdot_pl = -(delta_rho_nue+2.*delta_rho_numu)
                 Hubble_T = Hubble(T,Tnu,Tnu)
                 if(PRyMini.NP_thermo_flag):
                     TNP = TNPofT(T)
@@ -224,8 +313,11 @@ class PRyMclass(object):
             # Plasma entropy density normalized to T^3 (constant after e+- annihilation)
             def sbar(T):
                 return PRyMthermo.spl(T)/T**3
-            # Numerical derivative of the above wrt to temperature
-            if(PRyMini.numdiff_flag):
+            # Derivative of the above wrt to temperature
+            if(PRyMini.dspl_analytic_flag):
+                def dsbardT(T):
+                    return PRyMthermo.dspl_dT(T)/T**3-3.*PRyMthermo.spl(T)/T**4
+            elif(PRyMini.numdiff_flag):
                 from numdifftools import Derivative
                 dsbardT = Derivative(sbar,n=1)
             else:
@@ -245,8 +337,36 @@ class PRyMclass(object):
             # Assuming no change in plasma entropy per comoving volume after end of BBN
             zend = (z0/(sbar(Tend_MeV)/PRyMini.s0bar)**(1/3)) # iff d(spl*a^3) = 0
             # aend conveniently allows to sample from end of BBN instead of today
-            T_sol_vec = np.logspace(np.log10(Tend_MeV),np.log10(Tstart_MeV),PRyMini.n_sampling)
-            if(PRyMini.julia_flag):
+            T_sol_vec = np.logspace(np.log10(Tend_MeV),np.log10(Tstart_MeV),n_bckg)
+            if(PRyMini.aTid_quad_flag):
+                # dlog(a*T)/dlog(T) evaluated at once on background samples (increasing T)
+                T_smp, Tnu_smp = Tg_vec[::-1], Tnu_vec[::-1]
+                P_smp, dPdT_smp = PRyMthermo.QED_interp(T_smp)[:2]
+                rho_tot_smp = PRyMthermo.rho_g(T_smp)+PRyMthermo.rho_e_vec(T_smp)-P_smp+T_smp*dPdT_smp+3.*PRyMthermo.rho_nu(Tnu_smp)
+                delta_rho_nue_smp, delta_rho_numu_smp = PRyMthermo.delta_rho_nu_all(T_smp,Tnu_smp,Tnu_smp)
+                qdot_pl_smp = -(delta_rho_nue_smp+2.*delta_rho_numu_smp)
+                if(PRyMini.NP_thermo_flag):
+                    TNP_smp = TNP_vec[::-1]
+                    rho_tot_smp += np.vectorize(PRyMthermo.rho_NP)(TNP_smp)
+                    qdot_pl_smp -= np.vectorize(PRyMthermo.delta_rho_NP)(T_smp,Tnu_smp,Tnu_smp,TNP_smp)
+                if(PRyMini.NP_nu_flag):
+                    rho_tot_smp += np.vectorize(PRyMthermo.rho_NP)(Tnu_smp)
+                if(PRyMini.NP_e_flag):
+                    rho_tot_smp += np.vectorize(PRyMthermo.rho_NP)(T_smp)
+                Hubble_smp = PRyMini.MeV_to_secm1*(rho_tot_smp*8.*np.pi/(3.*PRyMini.Mpl**2))**0.5
+                N_nu_smp = -qdot_pl_smp/Hubble_smp/T_smp**4
+                sbar_smp = PRyMthermo.spl_vec(T_smp)/T_smp**3
+                if(PRyMini.dspl_analytic_flag):
+                    dsbardT_smp = PRyMthermo.dspl_dT_vec(T_smp)/T_smp**3-3.*sbar_smp/T_smp
+                else:
+                    dToT = 1.e-3
+                    dsbardT_smp = (PRyMthermo.spl_vec((1.+dToT)*T_smp)/((1.+dToT)*T_smp)**3-PRyMthermo.spl_vec((1.-dToT)*T_smp)/((1.-dToT)*T_smp)**3)/(2.*dToT*T_smp)
+                dlnadlnT_smp = -(3.*sbar_smp+T_smp*dsbardT_smp)/(3.*sbar_smp+N_nu_smp)
+                # Cumulative quadrature via antiderivative of cubic spline, anchored at T_end
+                lna_int = CubicSpline(np.log(T_smp),dlnadlnT_smp).antiderivative()
+                sol_lnT = np.log(T_sol_vec)
+                sol_lna = np.log(zend/Tend_MeV)+lna_int(sol_lnT)-lna_int(np.log(Tend_MeV))
+            elif(PRyMini.julia_flag):
                 logaend_vec = [np.log(zend/Tend_MeV)]
                 logaend = np.float64(logaend_vec)
                 Tspan = (np.float64(np.log(Tend_MeV)),np.float64(np.log(Tstart_MeV)))
@@ -263,7 +383,10 @@ class PRyMclass(object):
                 sol_lnT = np.array(sol_lnalnT.t[:]).flatten()
                 sol_lna = np.array(sol_lnalnT.y[:]).flatten()
             # log(a) as a function of log(T)
-            lnalnT = interp1d(sol_lnT,sol_lna,bounds_error=False,fill_value="extrapolate")
+            if(PRyMini.smooth_bckg_flag):
+                lnalnT = CubicSpline(sol_lnT,sol_lna)
+            else:
+                lnalnT = interp1d(sol_lnT,sol_lna,bounds_error=False,fill_value="extrapolate")
         
         # Scale factor as a function of temperature of thermal bath
         def a_of_T(T):
@@ -274,11 +397,22 @@ class PRyMclass(object):
             else:
                 spl_T = PRyMthermo.spl(T)
                 return (PRyMini.s0CMB/spl_T)**(1./3.)
-        a_of_T_vec = np.vectorize(a_of_T)
+        # Same as above for an array of temperatures (no Python loop)
+        def a_of_T_vec(T):
+            if(PRyMini.aTid_flag):
+                return np.exp(lnalnT(np.log(T)))
+            else:
+                return (PRyMini.s0CMB/PRyMthermo.spl_vec(T))**(1./3.)
         # Scale factor as a function of time
         a_in = a_of_T(Tg_vec[0])
         a_fin = a_of_T(Tg_vec[-1])
-        a_of_t = interp1d(t_vec[:],a_of_T_vec(Tg_vec),bounds_error=False,fill_value=(a_in,a_fin))
+        if(bckg is not None):
+            bckg.SetScaleFactor(a_of_T_vec)
+            a_of_t = bckg.a_of_t
+        elif(PRyMini.smooth_bckg_flag):
+            a_of_t = PRyMthermo.LogLogSpline(t_vec,a_of_T_vec(Tg_vec))
+        else:
+            a_of_t = interp1d(t_vec[:],a_of_T_vec(Tg_vec),bounds_error=False,fill_value=(a_in,a_fin))
         
         ##########################################
         # Baryon density for the nuclear network #
@@ -370,7 +504,12 @@ class PRyMclass(object):
         
         # Solving HT network
         Yi_vec = [Yn_i,Yp_i]
-        if(PRyMini.julia_flag):
+        if(PRyMini.HT_quad_flag):
+            t_HT = np.geomspace(t_init,t_fin,PRyMini.sampling_HT)
+            T_HT = T_of_t(t_HT)*PRyMini.MeV_to_Kelvin # temperature in [K]
+            Yn_HT_f = PRyMnTOp.NeutronFractionHT(t_HT,nTOp_frwrd(T_HT),nTOp_bkwrd(T_HT),Yn_i)
+            Yp_HT_f = 1.-Yn_HT_f
+        elif(PRyMini.julia_flag):
             Y0 = np.float64(Yi_vec)
             tspan = (np.float64(t_init),np.float64(t_fin))
             p0 = [lambda x: np.float64(T_of_t(x)*PRyMini.MeV_to_Kelvin),lambda x: np.float64(nTOp_frwrd(x)),lambda x: np.float64(nTOp_bkwrd(x))]
@@ -390,14 +529,15 @@ class PRyMclass(object):
         ########################
         # Import nuclear rates #
         ########################
+        import PRyM.PRyM_nuclear_network as PRyMnetwork
         if(PRyMini.smallnet_flag):
             import PRyM.PRyM_nuclear_net12 as PRyMnuclear
-            PRyMnucl = PRyMnuclear.UpdateNuclearRates(PRyMini.p_npdg,PRyMini.p_dpHe3g,PRyMini.p_ddHe3n,PRyMini.p_ddtp,PRyMini.p_tpag,PRyMini.p_tdan,PRyMini.p_taLi7g,PRyMini.p_He3ntp,PRyMini.p_He3dap,PRyMini.p_He3aBe7g,PRyMini.p_Be7nLi7p,PRyMini.p_Li7paa)
+            PRyMnucl = PRyMnuclear.UpdateNuclearRates() # weights p_R from PRyM_init
             if(PRyMini.julia_flag):
                 pMLT = [lambda x: np.float64(PRyMnucl.npdg_frwrd(x)),lambda x: np.float64(PRyMnucl.npdg_bkwrd(x)),lambda x: np.float64(PRyMnucl.dpHe3g_frwrd(x)),lambda x: np.float64(PRyMnucl.dpHe3g_bkwrd(x)),lambda x: np.float64(PRyMnucl.ddHe3n_frwrd(x)),lambda x: np.float64(PRyMnucl.ddHe3n_bkwrd(x)),lambda x: np.float64(PRyMnucl.ddtp_frwrd(x)),lambda x: np.float64(PRyMnucl.ddtp_bkwrd(x)),lambda x: np.float64(PRyMnucl.tpag_frwrd(x)),lambda x: np.float64(PRyMnucl.tpag_bkwrd(x)),lambda x: np.float64(PRyMnucl.tdan_frwrd(x)),lambda x: np.float64(PRyMnucl.tdan_bkwrd(x)),lambda x: np.float64(PRyMnucl.taLi7g_frwrd(x)),lambda x: np.float64(PRyMnucl.taLi7g_bkwrd(x)),lambda x: np.float64(PRyMnucl.He3ntp_frwrd(x)),lambda x: np.float64(PRyMnucl.He3ntp_bkwrd(x)),lambda x: np.float64(PRyMnucl.He3dap_frwrd(x)),lambda x: np.float64(PRyMnucl.He3dap_bkwrd(x)),lambda x: np.float64(PRyMnucl.He3aBe7g_frwrd(x)),lambda x: np.float64(PRyMnucl.He3aBe7g_bkwrd(x)),lambda x: np.float64(PRyMnucl.Be7nLi7p_frwrd(x)),lambda x: np.float64(PRyMnucl.Be7nLi7p_bkwrd(x)),lambda x: np.float64(PRyMnucl.Li7paa_frwrd(x)),lambda x: np.float64(PRyMnucl.Li7paa_bkwrd(x))]
         else:
             import PRyM.PRyM_nuclear_net63 as PRyMnuclear
-            PRyMnucl = PRyMnuclear.UpdateNuclearRates(PRyMini.p_npdg,PRyMini.p_dpHe3g,PRyMini.p_ddHe3n,PRyMini.p_ddtp,PRyMini.p_tpag,PRyMini.p_tdan,PRyMini.p_taLi7g,PRyMini.p_He3ntp,PRyMini.p_He3dap,PRyMini.p_He3aBe7g,PRyMini.p_Be7nLi7p,PRyMini.p_Li7paa,PRyMini.p_Li7paag,PRyMini.p_Be7naa,PRyMini.p_Be7daap,PRyMini.p_daLi6g,PRyMini.p_Li6pBe7g,PRyMini.p_Li6pHe3a,PRyMini.p_B8naap,PRyMini.p_Li6He3aap,PRyMini.p_Li6taan,PRyMini.p_Li6tLi8p,PRyMini.p_Li7He3Li6a,PRyMini.p_Li8He3Li7a,PRyMini.p_Be7tLi6a,PRyMini.p_B8tBe7a,PRyMini.p_B8nLi6He3,PRyMini.p_B8nBe7d,PRyMini.p_Li6tLi7d,PRyMini.p_Li6He3Be7d,PRyMini.p_Li7He3aad,PRyMini.p_Li8He3aat,PRyMini.p_Be7taad,PRyMini.p_Be7tLi7He3,PRyMini.p_B8dBe7He3,PRyMini.p_B8taaHe3,PRyMini.p_Be7He3ppaa,PRyMini.p_ddag,PRyMini.p_He3He3app,PRyMini.p_Be7pB8g,PRyMini.p_Li7daan,PRyMini.p_dntg,PRyMini.p_ttann,PRyMini.p_He3nag,PRyMini.p_He3tad,PRyMini.p_He3tanp,PRyMini.p_Li7taan,PRyMini.p_Li7He3aanp,PRyMini.p_Li8dLi7t,PRyMini.p_Be7taanp,PRyMini.p_Be7He3aapp,PRyMini.p_Li6nta,PRyMini.p_He3tLi6g,PRyMini.p_anpLi6g,PRyMini.p_Li6nLi7g,PRyMini.p_Li6dLi7p,PRyMini.p_Li6dBe7n,PRyMini.p_Li7nLi8g,PRyMini.p_Li7dLi8p,PRyMini.p_Li8paan,PRyMini.p_annHe6g,PRyMini.p_ppndp,PRyMini.p_Li7taann)
+            PRyMnucl = PRyMnuclear.UpdateNuclearRates() # weights p_R from PRyM_init
             if(PRyMini.julia_flag):
                 pMT = [lambda x: np.float64(PRyMnucl.npdg_frwrd(x)),lambda x: np.float64(PRyMnucl.npdg_bkwrd(x)),lambda x: np.float64(PRyMnucl.dpHe3g_frwrd(x)),lambda x: np.float64(PRyMnucl.dpHe3g_bkwrd(x)),lambda x: np.float64(PRyMnucl.ddHe3n_frwrd(x)),lambda x: np.float64(PRyMnucl.ddHe3n_bkwrd(x)),lambda x: np.float64(PRyMnucl.ddtp_frwrd(x)),lambda x: np.float64(PRyMnucl.ddtp_bkwrd(x)),lambda x: np.float64(PRyMnucl.tpag_frwrd(x)),lambda x: np.float64(PRyMnucl.tpag_bkwrd(x)),lambda x: np.float64(PRyMnucl.tdan_frwrd(x)),lambda x: np.float64(PRyMnucl.tdan_bkwrd(x)),lambda x: np.float64(PRyMnucl.taLi7g_frwrd(x)),lambda x: np.float64(PRyMnucl.taLi7g_bkwrd(x)),lambda x: np.float64(PRyMnucl.He3ntp_frwrd(x)),lambda x: np.float64(PRyMnucl.He3ntp_bkwrd(x)),lambda x: np.float64(PRyMnucl.He3dap_frwrd(x)),lambda x: np.float64(PRyMnucl.He3dap_bkwrd(x)),lambda x: np.float64(PRyMnucl.He3aBe7g_frwrd(x)),lambda x: np.float64(PRyMnucl.He3aBe7g_bkwrd(x)),lambda x: np.float64(PRyMnucl.Be7nLi7p_frwrd(x)),lambda x: np.float64(PRyMnucl.Be7nLi7p_bkwrd(x)),lambda x: np.float64(PRyMnucl.Li7paa_frwrd(x)),lambda x: np.float64(PRyMnucl.Li7paa_bkwrd(x)),lambda x: np.float64(PRyMnucl.Li7paag_frwrd(x)),lambda x: np.float64(PRyMnucl.Li7paag_bkwrd(x)),lambda x: np.float64(PRyMnucl.Be7naa_frwrd(x)),lambda x: np.float64(PRyMnucl.Be7naa_bkwrd(x)),lambda x: np.float64(PRyMnucl.Be7daap_frwrd(x)),lambda x: np.float64(PRyMnucl.Be7daap_bkwrd(x)),lambda x: np.float64(PRyMnucl.daLi6g_frwrd(x)),lambda x: np.float64(PRyMnucl.daLi6g_bkwrd(x)),lambda x: np.float64(PRyMnucl.Li6pBe7g_frwrd(x)),lambda x: np.float64(PRyMnucl.Li6pBe7g_bkwrd(x)),lambda x: np.float64(PRyMnucl.Li6pHe3a_frwrd(x)),lambda x: np.float64(PRyMnucl.Li6pHe3a_bkwrd(x))]
                 pLT = pMT+[lambda x: np.float64(PRyMnucl.B8naap_frwrd(x)),lambda x: np.float64(PRyMnucl.B8naap_bkwrd(x)),lambda x: np.float64(PRyMnucl.Li6He3aap_frwrd(x)),lambda x: np.float64(PRyMnucl.Li6He3aap_bkwrd(x)),lambda x: np.float64(PRyMnucl.Li6taan_frwrd(x)),lambda x: np.float64(PRyMnucl.Li6taan_bkwrd(x)),lambda x: np.float64(PRyMnucl.Li6tLi8p_frwrd(x)),lambda x: np.float64(PRyMnucl.Li6tLi8p_bkwrd(x)),lambda x: np.float64(PRyMnucl.Li7He3Li6a_frwrd(x)),lambda x: np.float64(PRyMnucl.Li7He3Li6a_bkwrd(x)),lambda x: np.float64(PRyMnucl.Li8He3Li7a_frwrd(x)),lambda x: np.float64(PRyMnucl.Li8He3Li7a_bkwrd(x)),lambda x: np.float64(PRyMnucl.Be7tLi6a_frwrd(x)),lambda x: np.float64(PRyMnucl.Be7tLi6a_bkwrd(x)),lambda x: np.float64(PRyMnucl.B8tBe7a_frwrd(x)),lambda x: np.float64(PRyMnucl.B8tBe7a_bkwrd(x)),lambda x: np.float64(PRyMnucl.B8nLi6He3_frwrd(x)),lambda x: np.float64(PRyMnucl.B8nLi6He3_bkwrd(x)),lambda x: np.float64(PRyMnucl.B8nBe7d_frwrd(x)),lambda x: np.float64(PRyMnucl.B8nBe7d_bkwrd(x)),lambda x: np.float64(PRyMnucl.Li6tLi7d_frwrd(x)),lambda x: np.float64(PRyMnucl.Li6tLi7d_bkwrd(x)),lambda x: np.float64(PRyMnucl.Li6He3Be7d_frwrd(x)),lambda x: np.float64(PRyMnucl.Li6He3Be7d_bkwrd(x)),lambda x: np.float64(PRyMnucl.Li7He3aad_frwrd(x)),lambda x: np.float64(PRyMnucl.Li7He3aad_bkwrd(x)),lambda x: np.float64(PRyMnucl.Li8He3aat_frwrd(x)),lambda x: np.float64(PRyMnucl.Li8He3aat_bkwrd(x)),lambda x: np.float64(PRyMnucl.Be7taad_frwrd(x)),lambda x: np.float64(PRyMnucl.Be7taad_bkwrd(x)),lambda x: np.float64(PRyMnucl.Be7tLi7He3_frwrd(x)),lambda x: np.float64(PRyMnucl.Be7tLi7He3_bkwrd(x)),lambda x: np.float64(PRyMnucl.B8dBe7He3_frwrd(x)),lambda x: np.float64(PRyMnucl.B8dBe7He3_bkwrd(x)),lambda x: np.float64(PRyMnucl.B8taaHe3_frwrd(x)),lambda x: np.float64(PRyMnucl.B8taaHe3_bkwrd(x)),lambda x: np.float64(PRyMnucl.Be7He3ppaa_frwrd(x)),lambda x: np.float64(PRyMnucl.Be7He3ppaa_bkwrd(x)),lambda x: np.float64(PRyMnucl.ddag_frwrd(x)),lambda x: np.float64(PRyMnucl.ddag_bkwrd(x)),lambda x: np.float64(PRyMnucl.He3He3app_frwrd(x)),lambda x: np.float64(PRyMnucl.He3He3app_bkwrd(x)),lambda x: np.float64(PRyMnucl.Be7pB8g_frwrd(x)),lambda x: np.float64(PRyMnucl.Be7pB8g_bkwrd(x)),lambda x: np.float64(PRyMnucl.Li7daan_frwrd(x)),lambda x: np.float64(PRyMnucl.Li7daan_bkwrd(x)),lambda x: np.float64(PRyMnucl.dntg_frwrd(x)),lambda x: np.float64(PRyMnucl.dntg_bkwrd(x)),lambda x: np.float64(PRyMnucl.ttann_frwrd(x)),lambda x: np.float64(PRyMnucl.ttann_bkwrd(x)),lambda x: np.float64(PRyMnucl.He3nag_frwrd(x)),lambda x: np.float64(PRyMnucl.He3nag_bkwrd(x)),lambda x: np.float64(PRyMnucl.He3tad_frwrd(x)),lambda x: np.float64(PRyMnucl.He3tad_bkwrd(x)),lambda x: np.float64(PRyMnucl.He3tanp_frwrd(x)),lambda x: np.float64(PRyMnucl.He3tanp_bkwrd(x)),lambda x: np.float64(PRyMnucl.Li7taan_frwrd(x)),lambda x: np.float64(PRyMnucl.Li7taan_bkwrd(x)),lambda x: np.float64(PRyMnucl.Li7He3aanp_frwrd(x)),lambda x: np.float64(PRyMnucl.Li7He3aanp_bkwrd(x)),lambda x: np.float64(PRyMnucl.Li8dLi7t_frwrd(x)),lambda x: np.float64(PRyMnucl.Li8dLi7t_bkwrd(x)),lambda x: np.float64(PRyMnucl.Be7taanp_frwrd(x)),lambda x: np.float64(PRyMnucl.Be7taanp_bkwrd(x)),lambda x: np.float64(PRyMnucl.Be7He3aapp_frwrd(x)),lambda x: np.float64(PRyMnucl.Be7He3aapp_bkwrd(x)),lambda x: np.float64(PRyMnucl.Li6nta_frwrd(x)),lambda x: np.float64(PRyMnucl.Li6nta_bkwrd(x)),lambda x: np.float64(PRyMnucl.He3tLi6g_frwrd(x)),lambda x: np.float64(PRyMnucl.He3tLi6g_bkwrd(x)),lambda x: np.float64(PRyMnucl.anpLi6g_frwrd(x)),lambda x: np.float64(PRyMnucl.anpLi6g_bkwrd(x)),lambda x: np.float64(PRyMnucl.Li6nLi7g_frwrd(x)),lambda x: np.float64(PRyMnucl.Li6nLi7g_bkwrd(x)),lambda x: np.float64(PRyMnucl.Li6dLi7p_frwrd(x)),lambda x: np.float64(PRyMnucl.Li6dLi7p_bkwrd(x)),lambda x: np.float64(PRyMnucl.Li6dBe7n_frwrd(x)),lambda x: np.float64(PRyMnucl.Li6dBe7n_bkwrd(x)),lambda x: np.float64(PRyMnucl.Li7nLi8g_frwrd(x)),lambda x: np.float64(PRyMnucl.Li7nLi8g_bkwrd(x)),lambda x: np.float64(PRyMnucl.Li7dLi8p_frwrd(x)),lambda x: np.float64(PRyMnucl.Li7dLi8p_bkwrd(x)),lambda x: np.float64(PRyMnucl.Li8paan_frwrd(x)),lambda x: np.float64(PRyMnucl.Li8paan_bkwrd(x)),lambda x: np.float64(PRyMnucl.annHe6g_frwrd(x)),lambda x: np.float64(PRyMnucl.annHe6g_bkwrd(x)),lambda x: np.float64(PRyMnucl.ppndp_frwrd(x)),lambda x: np.float64(PRyMnucl.ppndp_bkwrd(x)),lambda x: np.float64(PRyMnucl.Li7taann_frwrd(x)),lambda x: np.float64(PRyMnucl.Li7taann_bkwrd(x))]
@@ -405,52 +545,103 @@ class PRyMclass(object):
         #################################################
         # Local thermal equilibrium for nuclear species #
         #################################################
+        def YA_NSE(names,Yn,Yp,T):
+            # Nuclear statistical equilibrium with n,p at T [K], vectorized over species in names.
+            # Deliberately the Saha form of YA (masses, spins, binding energies), not a solve of the
+            # rate tables: their reverse rates come from detailed balance, so both give the same state.
+            Z = np.array([PRyMini.Nuclides[name][1] for name in names])
+            N = np.array([PRyMini.Nuclides[name][0] for name in names])
+            A = N+Z
+            Excess = np.array([PRyMini.NuclExcessMass[name] for name in names])
+            Spin = np.array([PRyMini.NuclSpin[name] for name in names])
+            Mass = A*PRyMini.ma*PRyMini.MeV+PRyMini.keV*Excess-Z*PRyMini.me*PRyMini.MeV
+            BindingE = N*PRyMini.NuclExcessMass["n"] + Z*PRyMini.NuclExcessMass["p"]-Excess
+            NormYA = (Mass/((PRyMini.mn*PRyMini.MeV)**N*(PRyMini.mp*PRyMini.MeV)**Z))**(3/2)
+            return (2*Spin+1)*zeta(3)**(A-1)*np.pi**((1-A)/2)*2**((3*A-5)/2)*NormYA*(PRyMini.kB*T)**(3/2*(A-1))*etab_of_T(T)**(A-1)*Yp**Z*Yn**N *np.exp(BindingE*PRyMini.keV/(PRyMini.kB*T))
+
         def YA(name,Yn,Yp,T):
-            x = PRyMini.Nuclides[name]
-            A = x[0]+x[1]
-            Z = x[1]
-            N = A-Z
-            Mass = A*PRyMini.ma*PRyMini.MeV+PRyMini.keV*PRyMini.NuclExcessMass[name]-Z*PRyMini.me*PRyMini.MeV
-            BindingE = N*PRyMini.NuclExcessMass["n"] + Z*PRyMini.NuclExcessMass["p"]-PRyMini.NuclExcessMass[name]
-            NormYA = (Mass/((PRyMini.mn*PRyMini.MeV)**(A-Z)*(PRyMini.mp*PRyMini.MeV)**Z))**(3/2)
-            return (2*PRyMini.NuclSpin[name]+1)*zeta(3)**(A-1)*np.pi**((1-A)/2)*2**((3*A-5)/2)*NormYA*(PRyMini.kB*T)**(3/2*(A-1))*etab_of_T(T)**(A-1)*Yp**Z*Yn**(A-Z) *np.exp(BindingE*PRyMini.keV/(PRyMini.kB*T))
+            return YA_NSE([name],Yn,Yp,T)[0]
         
         #########################################################
         # Nuclear network: Final yields for p,d,t,He3,a,Li7,Be7 #
         #########################################################
+        # T, rhoB, weak and nuclear rates at x: computed once for RHS and Jacobian
+        state_cache = {}
+        if(PRyMini.lnT_network_flag):
+            # x = ln(T/MeV): all rates scaled by dt/dlnT, so that network equations give dY/dlnT
+            lnT_bckg, lnt_bckg = np.log(Tg_vec[::-1]), np.log(t_vec[::-1])
+            dlntdlnT_bckg = CubicSpline(lnT_bckg,lnt_bckg)(lnT_bckg,1)
+            # ln(a), ln(t), ln(-dt/dlnT) in a single spline of ln(T)
+            bckg_of_lnT = CubicSpline(lnT_bckg,np.c_[np.log(a_of_T_vec(Tg_vec[::-1])),lnt_bckg,lnt_bckg+np.log(-dlntdlnT_bckg)])
+            def NetworkState(x):
+                if x not in state_cache:
+                    if len(state_cache) >= 4:
+                        del state_cache[next(iter(state_cache))]
+                    lna_x, lnt_x, lndtdlnT_x = bckg_of_lnT(x)
+                    dtdlnT = -np.exp(lndtdlnT_x)
+                    T_t = np.exp(x)*PRyMini.MeV_to_Kelvin # temperature in [K]
+                    frwrd, bkwrd = PRyMnucl.Rates(T_t)
+                    state_cache[x] = (T_t,rhoB_BBN(np.exp(lna_x)),dtdlnT*nTOp_frwrd(T_t),dtdlnT*nTOp_bkwrd(T_t),dtdlnT*frwrd,dtdlnT*bkwrd)
+                return state_cache[x]
+            def x_of_T(T):
+                return np.log(T)
+            def x_of_t(t):
+                return np.log(T_of_t(t))
+            def t_of_x(x):
+                return np.exp(bckg_of_lnT(x)[1])
+        else:
+            # x = t [s]
+            def NetworkState(t):
+                if t not in state_cache:
+                    if len(state_cache) >= 4:
+                        del state_cache[next(iter(state_cache))]
+                    T_t = T_of_t(t)*PRyMini.MeV_to_Kelvin # temperature in [K]
+                    rhoBBN = rhoB_BBN(a_of_t(t))
+                    frwrd, bkwrd = PRyMnucl.Rates(T_t)
+                    state_cache[t] = (T_t,rhoBBN,nTOp_frwrd(T_t),nTOp_bkwrd(T_t),frwrd,bkwrd)
+                return state_cache[t]
+            x_of_T = t_of_T
+            def x_of_t(t):
+                return t
+            def t_of_x(x):
+                return x
+
         if(PRyMini.smallnet_flag):
-            def Y_prime(t,Y):
-                rhoBBN = rhoB_BBN(a_of_t(t))
-                T_t = T_of_t(t)*PRyMini.MeV_to_Kelvin # temperature in [K]
-                dY = PRyMnucl.dYndt(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd),PRyMnucl.dYpdt(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd),PRyMnucl.dYddt(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd),PRyMnucl.dYtdt(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd),PRyMnucl.dYHe3dt(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd),PRyMnucl.dYadt(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd),PRyMnucl.dYLi7dt(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd),PRyMnucl.dYBe7dt(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd)
-                return dY
+            if(PRyMini.reaction_list_flag):
+                network = PRyMnucl.network
+                if(PRyMini.numba_flag and PRyMini.compiled_network_flag):
+                    network = PRyMnetwork.CompiledNetwork(network)
+                dYdt, dYdtJac = network.dYdt, network.Jacobian
+            else:
+                dYdt, dYdtJac = PRyMnucl.dYdt, PRyMnucl.Jacobian
+
+            def Y_prime(x,Y):
+                return dYdt(Y,NetworkState(x))
                 
-            def Jacobian(t,Y):
-                rhoBBN = rhoB_BBN(a_of_t(t))
-                T_t = T_of_t(t)*PRyMini.MeV_to_Kelvin # temperature in [K]
-                return PRyMnucl.Jacobian(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd)
+            def Jacobian(x,Y):
+                return dYdtJac(Y,NetworkState(x))
         else:
-            def Y_prime_MT(t,Y):
-                rhoBBN = rhoB_BBN(a_of_t(t))
-                T_t = T_of_t(t)*PRyMini.MeV_to_Kelvin # temperature in [K]
-                dY = PRyMnucl.dYndtMT(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd),PRyMnucl.dYpdtMT(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd),PRyMnucl.dYddtMT(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd),PRyMnucl.dYtdtMT(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd),PRyMnucl.dYHe3dtMT(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd),PRyMnucl.dYadtMT(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd),PRyMnucl.dYLi7dtMT(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd),PRyMnucl.dYBe7dtMT(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd),PRyMnucl.dYHe6dtMT(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd),PRyMnucl.dYLi8dtMT(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd),PRyMnucl.dYLi6dtMT(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd),PRyMnucl.dYB8dtMT(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd)
-                return dY
+            if(PRyMini.reaction_list_flag):
+                networkMT, networkLT = PRyMnucl.networkMT, PRyMnucl.networkLT
+                if(PRyMini.numba_flag and PRyMini.compiled_network_flag):
+                    networkMT, networkLT = PRyMnetwork.CompiledNetwork(networkMT), PRyMnetwork.CompiledNetwork(networkLT)
+                dYdtMT, dYdtMTJac = networkMT.dYdt, networkMT.Jacobian
+                dYdtLT, dYdtLTJac = networkLT.dYdt, networkLT.Jacobian
+            else:
+                dYdtMT, dYdtMTJac = PRyMnucl.dYdtMT, PRyMnucl.JacobianMT
+                dYdtLT, dYdtLTJac = PRyMnucl.dYdtLT, PRyMnucl.JacobianLT
+
+            def Y_prime_MT(x,Y):
+                return dYdtMT(Y,NetworkState(x))
                 
-            def Jacobian_MT(t,Y):
-                rhoBBN = rhoB_BBN(a_of_t(t))
-                T_t = T_of_t(t)*PRyMini.MeV_to_Kelvin # temperature in [K]
-                return PRyMnucl.JacobianMT(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd)
+            def Jacobian_MT(x,Y):
+                return dYdtMTJac(Y,NetworkState(x))
         
-            def Y_prime_LT(t,Y):
-                rhoBBN = rhoB_BBN(a_of_t(t))
-                T_t = T_of_t(t)*PRyMini.MeV_to_Kelvin # temperature in [K]
-                dY = PRyMnucl.dYndtLT(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd),PRyMnucl.dYpdtLT(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd),PRyMnucl.dYddtLT(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd),PRyMnucl.dYtdtLT(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd),PRyMnucl.dYHe3dtLT(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd),PRyMnucl.dYadtLT(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd),PRyMnucl.dYLi7dtLT(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd),PRyMnucl.dYBe7dtLT(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd),PRyMnucl.dYHe6dtLT(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd),PRyMnucl.dYLi8dtLT(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd),PRyMnucl.dYLi6dtLT(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd),PRyMnucl.dYB8dtLT(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd)
-                return dY
+            def Y_prime_LT(x,Y):
+                return dYdtLT(Y,NetworkState(x))
 
-            def Jacobian_LT(t,Y):
-                rhoBBN = rhoB_BBN(a_of_t(t))
-                T_t = T_of_t(t)*PRyMini.MeV_to_Kelvin # temperature in [K]
-                return PRyMnucl.JacobianLT(Y,T_t,rhoBBN,nTOp_frwrd,nTOp_bkwrd)
+            def Jacobian_LT(x,Y):
+                return dYdtLTJac(Y,NetworkState(x))
         
         ############################
         # Mid temperature solution #
@@ -458,9 +649,11 @@ class PRyMclass(object):
         if(PRyMini.verbose_flag):
             print("Solving nuclear network at mid temperature era")
             
-        # MT era definition
-        t_init = t_weak
+        # MT era definition: network starts at T_NSE <= T_weak
+        T_MT_start = min(PRyMini.T_NSE,PRyMini.T_weak)
+        t_init = t_of_T(T_MT_start/PRyMini.MeV_to_Kelvin) if T_MT_start < PRyMini.T_weak else t_weak
         t_fin = t_nucl
+        x_init, x_fin = x_of_T(T_MT_start/PRyMini.MeV_to_Kelvin), x_of_T(PRyMini.T_nucl/PRyMini.MeV_to_Kelvin)
         
         # Weak rates at MT
         def nTOp_frwrd(T):
@@ -468,20 +661,14 @@ class PRyMclass(object):
         def nTOp_bkwrd(T):
             return NormWeakRates*nTOp_bkwrd_MT(T)
         
-        # Initial conditions at MT
-        Yn_i = Yn_HT_f
-        Yp_i = Yp_HT_f
-        Yd_i = YA("d",Yn_i,Yp_i,PRyMini.T_weak)
-        Yt_i = YA("t",Yn_i,Yp_i,PRyMini.T_weak)
-        YHe3_i = YA("He3",Yn_i,Yp_i,PRyMini.T_weak)
-        Ya_i = YA("a",Yn_i,Yp_i,PRyMini.T_weak)
-        YLi7_i = YA("Li7",Yn_i,Yp_i,PRyMini.T_weak)
-        YBe7_i = YA("Be7",Yn_i,Yp_i,PRyMini.T_weak)
-        if(PRyMini.smallnet_flag == False):
-            YHe6_i = YA("He6",Yn_i,Yp_i,PRyMini.T_weak)
-            YLi8_i = YA("Li8",Yn_i,Yp_i,PRyMini.T_weak)
-            YLi6_i = YA("Li6",Yn_i,Yp_i,PRyMini.T_weak)
-            YB8_i = YA("B8",Yn_i,Yp_i,PRyMini.T_weak)
+        # Initial conditions at MT: only n <--> p from T_weak to T_NSE, nuclei in NSE at T_NSE
+        Yn_i, Yp_i = Yn_HT_f, Yp_HT_f
+        if(t_init > t_weak):
+            t_NSE = np.geomspace(t_weak,t_init,PRyMini.sampling_HT)
+            T_NSE = T_of_t(t_NSE)*PRyMini.MeV_to_Kelvin # temperature in [K]
+            Yn_i = PRyMnTOp.NeutronFractionHT(t_NSE,nTOp_frwrd(T_NSE),nTOp_bkwrd(T_NSE),Yn_i)
+            Yp_i = 1.-Yn_i
+        Yd_i,Yt_i,YHe3_i,Ya_i,YLi7_i,YBe7_i,YHe6_i,YLi8_i,YLi6_i,YB8_i = YA_NSE(["d","t","He3","a","Li7","Be7","He6","Li8","Li6","B8"],Yn_i,Yp_i,T_MT_start)
         
         # Solving MT network
         if(PRyMini.smallnet_flag):
@@ -496,7 +683,7 @@ class PRyMclass(object):
                 sol_at_MT = np.array(sol_at_MT.u)
                 Yn_MT_f,Yp_MT_f,Yd_MT_f,Yt_MT_f,YHe3_MT_f,Ya_MT_f,YLi7_MT_f,YBe7_MT_f = sol_at_MT[-1,:]
             else:
-                sol_at_MT = solve_ivp(Y_prime,[t_init,t_fin],Yi_vec,method='BDF',jac=Jacobian,rtol=1.e-6,atol=1.e-9)
+                sol_at_MT = solve_ivp(Y_prime,[x_init,x_fin],Yi_vec,method='BDF',jac=Jacobian,rtol=1.e-6,atol=1.e-9)
                 Yn_MT_f,Yp_MT_f,Yd_MT_f,Yt_MT_f,YHe3_MT_f,Ya_MT_f,YLi7_MT_f,YBe7_MT_f = sol_at_MT.y[0][-1],sol_at_MT.y[1][-1],sol_at_MT.y[2][-1],sol_at_MT.y[3][-1],sol_at_MT.y[4][-1],sol_at_MT.y[5][-1],sol_at_MT.y[6][-1],sol_at_MT.y[7][-1]
         else:
             Yi_vec = [Yn_i,Yp_i,Yd_i,Yt_i,YHe3_i,Ya_i,YLi7_i,YBe7_i,YHe6_i,YLi8_i,YLi6_i,YB8_i]
@@ -510,9 +697,14 @@ class PRyMclass(object):
                 sol_at_MT = np.array(sol_at_MT.u)
                 Yn_MT_f,Yp_MT_f,Yd_MT_f,Yt_MT_f,YHe3_MT_f,Ya_MT_f,YLi7_MT_f,YBe7_MT_f,YHe6_MT_f,YLi8_MT_f,YLi6_MT_f,YB8_MT_f = sol_at_MT[-1,:]
             else:
-                sol_at_MT = solve_ivp(Y_prime_MT,[t_init,t_fin],Yi_vec,method='BDF',jac=Jacobian_MT,rtol=1.e-6,atol=1.e-9)
+                sol_at_MT = solve_ivp(Y_prime_MT,[x_init,x_fin],Yi_vec,method='BDF',jac=Jacobian_MT,rtol=1.e-6,atol=1.e-9)
                 Yn_MT_f,Yp_MT_f,Yd_MT_f,Yt_MT_f,YHe3_MT_f,Ya_MT_f,YLi7_MT_f,YBe7_MT_f,YHe6_MT_f,YLi8_MT_f,YLi6_MT_f,YB8_MT_f = sol_at_MT.y[0][-1],sol_at_MT.y[1][-1],sol_at_MT.y[2][-1],sol_at_MT.y[3][-1],sol_at_MT.y[4][-1],sol_at_MT.y[5][-1],sol_at_MT.y[6][-1],sol_at_MT.y[7][-1],sol_at_MT.y[8][-1],sol_at_MT.y[9][-1],sol_at_MT.y[10][-1],sol_at_MT.y[11][-1]
         
+        # LT solver started with the last MT step size instead of a fresh initial step (scipy only)
+        first_step_LT = None
+        if(PRyMini.carry_step_LT_flag and not PRyMini.julia_flag):
+            first_step_LT = abs(sol_at_MT.t[-1]-sol_at_MT.t[-2])
+        
         if(PRyMini.verbose_flag):
             print("--- running time: %s seconds ---" % (time.time() - start_time))
             print(" ")
@@ -526,12 +718,36 @@ class PRyMclass(object):
         # LT era definition
         t_init = t_nucl
         t_fin = t_end
+        x_init, x_fin = x_of_T(PRyMini.T_nucl/PRyMini.MeV_to_Kelvin), x_of_T(PRyMini.T_end/PRyMini.MeV_to_Kelvin)
 
         # Weak rates at LT
         def nTOp_frwrd(T):
             return NormWeakRates*nTOp_frwrd_LT(T)
         def nTOp_bkwrd(T):
             return NormWeakRates*nTOp_bkwrd_LT(T)
+        state_cache.clear()
+
+        # Steady state: |dY/dt| x remaining time below a fraction of the tolerance for all species
+        # (species being depleted cannot change by more than their abundance)
+        def SteadyStateLT(dYdt,rtol,atol):
+            def Steady(x,Y):
+                Y = np.asarray(Y)
+                dY = dYdt(Y,NetworkState(x))*(x_fin-x)
+                change = np.where(dY*Y < 0.,np.minimum(np.abs(dY),np.abs(Y)),np.abs(dY))
+                return np.max(change/(atol+rtol*np.abs(Y)))-PRyMini.steady_LT_frac
+            Steady.terminal = True
+            Steady.direction = -1
+            return Steady
+
+        # After steady state: nuclear rates frozen, n <--> p only (fraction of n in Yn+Yp by quadrature)
+        def WeakDecayLT(Yn,Yp,t_stop):
+            if(t_stop >= t_fin*(1.-1.e-6)): # nothing left to extrapolate
+                return Yn, Yp
+            t_dec = np.geomspace(t_stop,t_fin,PRyMini.sampling_HT)
+            T_dec = T_of_t(t_dec)*PRyMini.MeV_to_Kelvin # temperature in [K]
+            Ynp = Yn+Yp
+            Yn_f = Ynp*PRyMnTOp.NeutronFractionHT(t_dec,nTOp_frwrd(T_dec),nTOp_bkwrd(T_dec),Yn/Ynp)
+            return Yn_f, Ynp-Yn_f
             
         # Initial conditions at LT
         Yn_i = Yn_MT_f
@@ -556,12 +772,19 @@ class PRyMclass(object):
                 p0 = [lambda x: np.float64(T_of_t(x)*PRyMini.MeV_to_Kelvin),lambda x: np.float64(rhoB_BBN(a_of_t(x))),lambda x: np.float64(NormWeakRates*nTOp_frwrd_LT(x)),lambda x: np.float64(NormWeakRates*nTOp_bkwrd_LT(x))] + pMLT
                 f_Y_prime_LT_jl = de.ODEFunction(PRyMjl.Y_prime_MLT_jl,jac = PRyMjl.Jacobian_MLT_jl)
                 prob = de.ODEProblem(f_Y_prime_LT_jl,Y0,tspan,p0,abstol=1.e-13)
-                sol_at_LT = de.solve(prob,de.CVODE_BDF())
+                if(PRyMini.steady_LT_flag):
+                    Steady = SteadyStateLT(dYdt,1.e-3,1.e-13)
+                    sol_at_LT = de.solve(prob,de.CVODE_BDF(),callback=de.DiscreteCallback(lambda u,t,integrator: Steady(x_of_t(t),u) < 0.,de.terminate_b))
+                else:
+                    sol_at_LT = de.solve(prob,de.CVODE_BDF())
+                t_stop = sol_at_LT.t[-1]
                 sol_at_LT = np.array(sol_at_LT.u)
                 Yn_f,Yp_f,Yd_f,Yt_f,YHe3_f,Ya_f,YLi7_f,YBe7_f = sol_at_LT[-1,:]
             else:
-                sol_at_LT = solve_ivp(Y_prime,[t_init,t_fin],Yi_vec,method='BDF',jac=Jacobian,atol=1.e-11)
+                sol_at_LT = solve_ivp(Y_prime,[x_init,x_fin],Yi_vec,method='BDF',jac=Jacobian,atol=1.e-11,first_step=first_step_LT,events=SteadyStateLT(dYdt,1.e-3,1.e-11) if PRyMini.steady_LT_flag else None)
+                t_stop = t_of_x(sol_at_LT.t[-1]) if sol_at_LT.status == 1 else t_fin
                 Yn_f,Yp_f,Yd_f,Yt_f,YHe3_f,Ya_f,YLi7_f,YBe7_f = sol_at_LT.y[0][-1],sol_at_LT.y[1][-1],sol_at_LT.y[2][-1],sol_at_LT.y[3][-1],sol_at_LT.y[4][-1],sol_at_LT.y[5][-1],sol_at_LT.y[6][-1],sol_at_LT.y[7][-1]
+            Yn_f,Yp_f = WeakDecayLT(Yn_f,Yp_f,t_stop)
         else:
             Yi_vec = [Yn_i,Yp_i,Yd_i,Yt_i,YHe3_i,Ya_i,YLi7_i,YBe7_i,YHe6_i,YLi8_i,YLi6_i,YB8_i]
             if(PRyMini.julia_flag):
@@ -570,12 +793,19 @@ class PRyMclass(object):
                 p0 = [lambda x: np.float64(T_of_t(x)*PRyMini.MeV_to_Kelvin),lambda x: np.float64(rhoB_BBN(a_of_t(x))),lambda x: np.float64(NormWeakRates*nTOp_frwrd_LT(x)),lambda x: np.float64(NormWeakRates*nTOp_bkwrd_LT(x))] + pLT
                 f_Y_prime_LT_jl = de.ODEFunction(PRyMjl.Y_prime_LT_jl,jac=PRyMjl.Jacobian_LT_jl)
                 prob = de.ODEProblem(f_Y_prime_LT_jl,Y0,tspan,p0,abstol=1.e-16)
-                sol_at_LT = de.solve(prob,de.CVODE_BDF())
+                if(PRyMini.steady_LT_flag):
+                    Steady = SteadyStateLT(dYdtLT,1.e-3,1.e-16)
+                    sol_at_LT = de.solve(prob,de.CVODE_BDF(),callback=de.DiscreteCallback(lambda u,t,integrator: Steady(x_of_t(t),u) < 0.,de.terminate_b))
+                else:
+                    sol_at_LT = de.solve(prob,de.CVODE_BDF())
+                t_stop = sol_at_LT.t[-1]
                 sol_at_LT = np.array(sol_at_LT.u)
                 Yn_f,Yp_f,Yd_f,Yt_f,YHe3_f,Ya_f,YLi7_f,YBe7_f,YHe6_f,YLi8_f,YLi6_f,YB8_f = sol_at_LT[-1,:]
+                Yn_f,Yp_f = WeakDecayLT(Yn_f,Yp_f,t_stop)
             else:
-                sol_at_LT = solve_ivp(Y_prime_LT,[t_init,t_fin],Yi_vec,method='BDF',jac=Jacobian_LT,atol=1.e-15)
+                sol_at_LT = solve_ivp(Y_prime_LT,[x_init,x_fin],Yi_vec,method='BDF',jac=Jacobian_LT,atol=1.e-15,first_step=first_step_LT,events=SteadyStateLT(dYdtLT,1.e-3,1.e-15) if PRyMini.steady_LT_flag else None)
                 Yn_f,Yp_f,Yd_f,Yt_f,YHe3_f,Ya_f,YLi7_f,YBe7_f,YHe6_f,YLi8_f,YLi6_f,YB8_f = sol_at_LT.y[0][-1],sol_at_LT.y[1][-1],sol_at_LT.y[2][-1],sol_at_LT.y[3][-1],sol_at_LT.y[4][-1],sol_at_LT.y[5][-1],sol_at_LT.y[6][-1],sol_at_LT.y[7][-1],sol_at_LT.y[8][-1],sol_at_LT.y[9][-1],sol_at_LT.y[10][-1],sol_at_LT.y[11][-1]
+                Yn_f,Yp_f = WeakDecayLT(Yn_f,Yp_f,t_of_x(sol_at_LT.t[-1]) if sol_at_LT.status == 1 else t_fin)
 
         if(PRyMini.verbose_flag):
             print("--- running time: %s seconds ---" % (time.time() - start_time))
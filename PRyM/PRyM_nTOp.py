@@ -1,26 +1,28 @@
 # -*- coding: utf-8 -*-
 import numpy as np
 from scipy.interpolate import interp1d
+from scipy.integrate import cumulative_simpson, simpson
 import PRyM.PRyM_init as PRyMini
+import PRyM.PRyM_tables as PRyMtables
 
 my_dir = PRyMini.working_dir
 
 def InterpolateWeakRates():
     # Upload p,n weak rates
     # HT interval: T_start --> T_weak
-    nTOp_frwrd_HT_tab = np.loadtxt(my_dir+"/PRyMrates/nTOp/"+"nTOp_frwrd_HT.txt")
+    nTOp_frwrd_HT_tab = PRyMtables.LoadTable(my_dir+"/PRyMrates/nTOp/"+"nTOp_frwrd_HT.txt")
     nTOp_frwrd_HT = interp1d(nTOp_frwrd_HT_tab[:,0],nTOp_frwrd_HT_tab[:,1], bounds_error=False,fill_value="extrapolate",kind='quadratic')
-    nTOp_bkwrd_HT_tab = np.loadtxt(my_dir+"/PRyMrates/nTOp/"+"nTOp_bkwrd_HT.txt")
+    nTOp_bkwrd_HT_tab = PRyMtables.LoadTable(my_dir+"/PRyMrates/nTOp/"+"nTOp_bkwrd_HT.txt")
     nTOp_bkwrd_HT = interp1d(nTOp_bkwrd_HT_tab[:,0],nTOp_bkwrd_HT_tab[:,1], bounds_error=False,fill_value="extrapolate",kind='quadratic')
     # MT interval: T_weak --> T_nucl
-    nTOp_frwrd_MT_tab = np.loadtxt(my_dir+"/PRyMrates/nTOp/"+"nTOp_frwrd_MT.txt")
+    nTOp_frwrd_MT_tab = PRyMtables.LoadTable(my_dir+"/PRyMrates/nTOp/"+"nTOp_frwrd_MT.txt")
     nTOp_frwrd_MT = interp1d(nTOp_frwrd_MT_tab[:,0],nTOp_frwrd_MT_tab[:,1], bounds_error=False,fill_value="extrapolate",kind='quadratic')
-    nTOp_bkwrd_MT_tab = np.loadtxt(my_dir+"/PRyMrates/nTOp/"+"nTOp_bkwrd_MT.txt")
+    nTOp_bkwrd_MT_tab = PRyMtables.LoadTable(my_dir+"/PRyMrates/nTOp/"+"nTOp_bkwrd_MT.txt")
     nTOp_bkwrd_MT = interp1d(nTOp_bkwrd_MT_tab[:,0],nTOp_bkwrd_MT_tab[:,1], bounds_error=False,fill_value="extrapolate",kind='quadratic')
     # LT interval: T_nucl --> T_end
-    nTOp_frwrd_LT_tab = np.loadtxt(my_dir+"/PRyMrates/nTOp/"+"nTOp_frwrd_LT.txt")
+    nTOp_frwrd_LT_tab = PRyMtables.LoadTable(my_dir+"/PRyMrates/nTOp/"+"nTOp_frwrd_LT.txt")
     nTOp_frwrd_LT = interp1d(nTOp_frwrd_LT_tab[:,0],nTOp_frwrd_LT_tab[:,1], bounds_error=False,fill_value="extrapolate",kind='quadratic')
-    nTOp_bkwrd_LT_tab = np.loadtxt(my_dir+"/PRyMrates/nTOp/"+"nTOp_bkwrd_LT.txt")
+    nTOp_bkwrd_LT_tab = PRyMtables.LoadTable(my_dir+"/PRyMrates/nTOp/"+"nTOp_bkwrd_LT.txt")
     nTOp_bkwrd_LT = interp1d(nTOp_bkwrd_LT_tab[:,0],nTOp_bkwrd_LT_tab[:,1], bounds_error=False,fill_value="extrapolate",kind='quadratic')
     return [nTOp_frwrd_HT,nTOp_bkwrd_HT,nTOp_frwrd_MT,nTOp_bkwrd_MT,nTOp_frwrd_LT,nTOp_bkwrd_LT]
 
@@ -50,3 +52,10 @@ def RecomputeWeakRates(Tvec):
     else:
         nTOp_frwrd_HT,nTOp_bkwrd_HT,nTOp_frwrd_MT,nTOp_bkwrd_MT,nTOp_frwrd_LT,nTOp_bkwrd_LT = InterpolateWeakRates()
         return [nTOp_frwrd_HT,nTOp_bkwrd_HT,nTOp_frwrd_MT,nTOp_bkwrd_MT,nTOp_frwrd_LT,nTOp_bkwrd_LT]
+
+def NeutronFractionHT(t_vec,nTOp_frwrd_vec,nTOp_bkwrd_vec,Yn_i):
+    # With Yn+Yp=1: dYn/dt = nTOp_bkwrd - (nTOp_frwrd+nTOp_bkwrd)*Yn, solved with integrating
+    # factor exp(I), I = cumulative integral of total rate, by Simpson quadrature in ln(t)
+    x = np.log(t_vec)
+    I = cumulative_simpson((nTOp_frwrd_vec+nTOp_bkwrd_vec)*t_vec,x=x,initial=0.)
+    return Yn_i*np.exp(-I[-1]) + simpson(nTOp_bkwrd_vec*t_vec*np.exp(I-I[-1]),x=x)
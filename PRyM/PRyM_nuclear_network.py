@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+import os
+import sys
+import hashlib
+import importlib.util
+from math import factorial
+from collections import Counter
+import numpy as np
+import PRyM.PRyM_init as PRyMini
+
+#########################
+# Declarative reactions #
+#########################
+# Nuclear species in the order of the abundance vector Y (first 8 for the small network)
+species = ["n","p","d","t","He3","a","Li7","Be7","He6","Li8","Li6","B8"]
+# Reactants --> products of each reaction (photons omitted). Rate tables and detailed balance
+# coefficients alpha_R, beta_R, gamma_R are the ones of PRyM_init for the same name R.
+# Forward flux: rhoB**(N-1) * rate * prod(Y_i**n_i/n_i!) for N reactants, n_i of species i;
+# backward flux: same with products and reverse rate.
+reactions = {
+    # 12 key reactions
+    "npdg": (["n","p"],["d"]),
+    "dpHe3g": (["d","p"],["He3"]),
+    "ddHe3n": (["d","d"],["He3","n"]),
+    "ddtp": (["d","d"],["t","p"]),
+    "tpag": (["t","p"],["a"]),
+    "tdan": (["t","d"],["a","n"]),
+    "taLi7g": (["t","a"],["Li7"]),
+    "He3ntp": (["He3","n"],["t","p"]),
+    "He3dap": (["He3","d"],["a","p"]),
+    "He3aBe7g": (["He3","a"],["Be7"]),
+    "Be7nLi7p": (["Be7","n"],["Li7","p"]),
+    "Li7paa": (["Li7","p"],["a","a"]),
+    # Other reactions
+    "Li7paag": (["Li7","p"],["a","a"]),
+    "Be7naa": (["Be7","n"],["a","a"]),
+    "Be7daap": (["Be7","d"],["a","a","p"]),
+    "daLi6g": (["d","a"],["Li6"]),
+    "Li6pBe7g": (["Li6","p"],["Be7"]),
+    "Li6pHe3a": (["Li6","p"],["He3","a"]),
+    "B8naap": (["B8","n"],["a","a","p"]),
+    "Li6He3aap": (["Li6","He3"],["a","a","p"]),
+    "Li6taan": (["Li6","t"],["a","a","n"]),
+    "Li6tLi8p": (["Li6","t"],["Li8","p"]),
+    "Li7He3Li6a": (["Li7","He3"],["Li6","a"]),
+    "Li8He3Li7a": (["Li8","He3"],["Li7","a"]),
+    "Be7tLi6a": (["Be7","t"],["Li6","a"]),
+    "B8tBe7a": (["B8","t"],["Be7","a"]),
+    "B8nLi6He3": (["B8","n"],["Li6","He3"]),
+    "B8nBe7d": (["B8","n"],["Be7","d"]),
+    "Li6tLi7d": (["Li6","t"],["Li7","d"]),
+    "Li6He3Be7d": (["Li6","He3"],["Be7","d"]),
+    "Li7He3aad": (["Li7","He3"],["a","a","d"]),
+    "Li8He3aat": (["Li8","He3"],["a","a","t"]),
+    "Be7taad": (["Be7","t"],["a","a","d"]),
+    "Be7tLi7He3": (["Be7","t"],["Li7","He3"]),
+    "B8dBe7He3": (["B8","d"],["Be7","He3"]),
+    "B8taaHe3": (["B8","t"],["a","a","He3"]),
+    "Be7He3ppaa": (["Be7","He3"],["p","p","a","a"]),
+    "ddag": (["d","d"],["a"]),
+    "He3He3app": (["He3","He3"],["a","p","p"]),
+    "Be7pB8g": (["Be7","p"],["B8"]),
+    "Li7daan": (["Li7","d"],["a","a","n"]),
+    "dntg": (["d","n"],["t"]),
+    "ttann": (["t","t"],["a","n","n"]),
+    "He3nag": (["He3","n"],["a"]),
+    "He3tad": (["He3","t"],["a","d"]),
+    "He3tanp": (["He3","t"],["a","n","p"]),
+    "Li7taan": (["Li7","t"],["a","a","n","n"]), # not part of any era network
+    "Li7He3aanp": (["Li7","He3"],["a","a","n","p"]),
+    "Li8dLi7t": (["Li8","d"],["Li7","t"]),
+    "Be7taanp": (["Be7","t"],["a","a","n","p"]),
+    "Be7He3aapp": (["Be7","He3"],["a","a","p","p"]),
+    "Li6nta": (["Li6","n"],["t","a"]),
+    "He3tLi6g": (["He3","t"],["Li6"]),
+    "anpLi6g": (["a","n","p"],["Li6"]),
+    "Li6nLi7g": (["Li6","n"],["Li7"]),
+    "Li6dLi7p": (["Li6","d"],["Li7","p"]),
+    "Li6dBe7n": (["Li6","d"],["Be7","n"]),
+    "Li7nLi8g": (["Li7","n"],["Li8"]),
+    "Li7dLi8p": (["Li7","d"],["Li8","p"]),
+    "Li8paan": (["Li8","p"],["a","a","n"]),
+    "annHe6g": (["a","n","n"],["He6"]),
+    "ppndp": (["p","p","n"],["d","p"]),
+    "Li7taann": (["Li7","t"],["a","a","n","n"]),
+}
+# Reactions of each era network
+network12_reactions = ["npdg","dpHe3g","ddHe3n","ddtp","tpag","tdan","taLi7g","He3ntp","He3dap","He3aBe7g","Be7nLi7p","Li7paa"]
+networkMT_reactions = network12_reactions+["Li7paag","Be7naa","Be7daap","daLi6g","Li6pBe7g"]
+networkLT_reactions = [name for name in reactions if name != "Li7taan"]
+
+#########################
+# Reaction list network #
+#########################
+def Side(names,index):
+    # Species indices (padded with index of Y=1 entry), symmetry factor, number of nuclei
+    count = Counter(names)
+    sym = 1.
+    for name in count:
+        sym *= factorial(count[name])
+    return [index[name] for name in names], 1./sym, len(names)
+
+class ReactionNetwork(object):
+    # dY/dt and Jacobian of the reactions listed in names (plus n <--> p weak rates),
+    # for rates ordered as rate_names and abundances ordered as species[:n_species].
+    # Jacobian returned as a dense array: with at most 12 species it is mostly filled
+    # (120 of 144 entries at LT) and dense LU is ~5 times faster than sparse LU here.
+    def __init__(self,names,rate_names,n_species=len(species)):
+        self.n = n_species
+        index = {name: i for i, name in enumerate(species[:n_species])}
+        index["one"] = n_species
+        # Weak n <--> p rates as an extra reaction, last in the list
+        sides = [(reactions[name][0],reactions[name][1]) for name in names]+[(["n"],["p"])]
+        self.sides = sides
+        self.rate_index = np.array([rate_names.index(name) for name in names])
+        fwd = [Side(lhs,index) for lhs, rhs in sides]
+        bwd = [Side(rhs,index) for lhs, rhs in sides]
+        width = max(len(side[0]) for side in fwd+bwd)
+        # Index arrays for fluxes: rows are reactions, padded with Y=1 entries
+        self.lhs = np.array([side[0]+[n_species]*(width-len(side[0])) for side in fwd])
+        self.rhs = np.array([side[0]+[n_species]*(width-len(side[0])) for side in bwd])
+        self.lhs_sym = np.array([side[1] for side in fwd])
+        self.rhs_sym = np.array([side[1] for side in bwd])
+        self.lhs_pow = np.array([side[2]-1 for side in fwd])
+        self.rhs_pow = np.array([side[2]-1 for side in bwd])
+        self.lhs_pow[-1] = self.rhs_pow[-1] = 0
+        # Stoichiometry: (species, reaction, net number of nuclei produced)
+        stoich = []
+        for r, (lhs, rhs) in enumerate(sides):
+            net = Counter(rhs)
+            net.subtract(Counter(lhs))
+            stoich += [(index[name],r,dn) for name, dn in net.items() if dn != 0]
+        self.stoich_species, self.stoich_reaction, self.stoich_coeff = [np.array(x) for x in zip(*stoich)]
+        # Partial derivatives of fluxes: d(flux_r)/dY_col = coeff * prod(Y[others])
+        partials = []
+        for sign, table in [(1.,self.lhs),(-1.,self.rhs)]:
+            for r, row in enumerate(table):
+                for s, col in enumerate(row):
+                    if col < n_species:
+                        partials.append((r,col,sign,list(row[:s])+list(row[s+1:]),table is self.rhs))
+        self.partial_reaction = np.array([p[0] for p in partials])
+        self.partial_col = np.array([p[1] for p in partials])
+        self.partial_sign = np.array([p[2] for p in partials])
+        self.partial_others = np.array([p[3] for p in partials])
+        self.partial_bwd = np.array([p[4] for p in partials])
+        # Jacobian: J[k,col] += stoich(k,r) * d(flux_r)/dY_col, as flattened positions
+        pos, coeff, src = [], [], []
+        for k, r, dn in stoich:
+            for p in np.flatnonzero(self.partial_reaction == r):
+                pos.append(k*n_species+self.partial_col[p])
+                coeff.append(dn)
+                src.append(p)
+        self.jac_pos, self.jac_coeff, self.jac_src = np.array(pos), np.array(coeff,dtype=float), np.array(src)
+
+    def Rates(self,state):
+        # Forward and backward rate constants, including rhoB powers and symmetry factors
+        T_t, rhoBBN, nTOp_frwrd, nTOp_bkwrd, frwrd, bkwrd = state
+        f = np.append(np.asarray(frwrd)[self.rate_index],nTOp_frwrd)
+        b = np.append(np.asarray(bkwrd)[self.rate_index],nTOp_bkwrd)
+        return f*self.lhs_sym*rhoBBN**self.lhs_pow, b*self.rhs_sym*rhoBBN**self.rhs_pow
+
+    def dYdt(self,Y,state):
+        # Time derivatives of all abundances, state = [T,rhoB,n <--> p rates,nuclear rates] at t
+        f, b = self.Rates(state)
+        Y1 = np.append(Y,1.)
+        flux = f*np.prod(Y1[self.lhs],axis=1)-b*np.prod(Y1[self.rhs],axis=1)
+        return np.bincount(self.stoich_species,weights=self.stoich_coeff*flux[self.stoich_reaction],minlength=self.n)
+
+    def Jacobian(self,Y,state):
+        # Jacobian of dYdt at the same state, accumulated from the nonzero partial derivatives
+        f, b = self.Rates(state)
+        Y1 = np.append(Y,1.)
+        k = np.where(self.partial_bwd,b[self.partial_reaction],f[self.partial_reaction])
+        dflux = self.partial_sign*k*np.prod(Y1[self.partial_others],axis=1)
+        jac = np.bincount(self.jac_pos,weights=self.jac_coeff*dflux[self.jac_src],minlength=self.n*self.n)
+        return jac.reshape(self.n,self.n)
+
+########################################
+# Straight-line kernels of the network #
+########################################
+# Generated source files (and Numba cache next to them), keyed by network hash
+kernel_dir = PRyMini.working_dir+"/PRyMrates/kernels/"
+# Bump whenever the generated code changes
+kernel_version = 1
+
+def Monomial(names,index):
+    # Product of abundances, e.g. ["d","d"] --> "Y2*Y2"
+    return ["Y%d" % index[name] for name in names]
+
+def Number(x):
+    return repr(float(x))
+
+def Product(factors):
+    # Drop unit factors, e.g. ["1.0","rhoB","f[2]"] --> "rhoB*f[2]"
+    factors = [x for x in factors if x not in ("1.0","1.")]
+    return "*".join(factors) or "1."
+
+def Sum(terms):
+    # Linear combination of (coefficient,name), e.g. [(-1.,"q0"),(2.,"q1")] --> "-q0 + 2.0*q1"
+    res = ""
+    for coeff, name in terms:
+        term = Product([Number(abs(coeff)),name])
+        res += ("-" if coeff < 0 else "") + term if not res else (" - " if coeff < 0 else " + ") + term
+    return res or "0."
+
+def KernelSource(network):
+    # Python source of dYdt(Y,f,b,rhoB,wf,wb) and Jacobian(Y,f,b,rhoB,wf,wb) for Numba
+    n = network.n
+    index = {name: i for i, name in enumerate(species[:n])}
+    rho = ["1.","rhoB","rhoB2","rhoB3"]
+    head = ["    Y%d = Y[%d]" % (i,i) for i in range(n)]+["    rhoB2 = rhoB*rhoB","    rhoB3 = rhoB2*rhoB"]
+    # Rate constants: symmetry factor * rhoB power * rate
+    for r, (lhs, rhs) in enumerate(network.sides):
+        weak = (r == len(network.sides)-1)
+        kf = "wf" if weak else "f[%d]" % network.rate_index[r]
+        kb = "wb" if weak else "b[%d]" % network.rate_index[r]
+        head.append("    kf%d = %s" % (r,Product([Number(network.lhs_sym[r]),rho[network.lhs_pow[r]],kf])))
+        head.append("    kb%d = %s" % (r,Product([Number(network.rhs_sym[r]),rho[network.rhs_pow[r]],kb])))
+    # Net stoichiometry per species
+    terms = [[] for i in range(n)]
+    for k, r, dn in zip(network.stoich_species,network.stoich_reaction,network.stoich_coeff):
+        terms[k].append((r,dn))
+    rhs = ["def dYdt(Y,f,b,rhoB,wf,wb):"]+head
+    for r, (lhs, prod) in enumerate(network.sides):
+        rhs.append("    q%d = %s - %s" % (r,Product(["kf%d" % r]+Monomial(lhs,index)),Product(["kb%d" % r]+Monomial(prod,index))))
+    rhs.append("    dY = np.empty(%d)" % n)
+    for k in range(n):
+        rhs.append("    dY[%d] = %s" % (k,Sum([(dn,"q%d" % r) for r, dn in terms[k]])))
+    rhs.append("    return dY")
+    # Derivatives of each flux: d(q_r)/dY_c
+    jac = ["def Jacobian(Y,f,b,rhoB,wf,wb):"]+head
+    for r, (lhs, prod) in enumerate(network.sides):
+        for c in sorted(set(index[name] for name in lhs+prod)):
+            parts = []
+            for sign, k, side in [(1.,"kf%d" % r,lhs),(-1.,"kb%d" % r,prod)]:
+                m = side.count(species[c])
+                if m:
+                    others = list(side)
+                    others.remove(species[c])
+                    parts.append((sign*m,Product(["kf%d" % r if sign > 0 else "kb%d" % r]+Monomial(others,index))))
+            jac.append("    d%d_%d = %s" % (r,c,Sum(parts)))
+    jac.append("    J = np.zeros((%d,%d))" % (n,n))
+    for k in range(n):
+        for c in range(n):
+            entry = [(dn,"d%d_%d" % (r,c)) for r, dn in terms[k] if c in network.lhs[r] or c in network.rhs[r]]
+            if entry:
+                jac.append("    J[%d,%d] = %s" % (k,c,Sum(entry)))
+    jac.append("    return J")
+    return "# -*- coding: utf-8 -*-\n# Generated by PRyM_nuclear_network.py, do not edit\nimport numpy as np\n\n"+"\n".join(rhs)+"\n\n"+"\n".join(jac)+"\n"
+
+def NetworkHash(network):
+    # Species, reactions and rate slots fully determine the generated kernels
+    key = [repr(kernel_version),repr(species[:network.n]),repr(network.sides),repr(list(network.rate_index))]
+    return hashlib.sha1("\n".join(key).encode()).hexdigest()
+
+def LoadKernels(network):
+    # Numba-compiled (dYdt,Jacobian), generated once per network and cached in kernel_dir
+    from numba import njit
+    key = NetworkHash(network)
+    file_name = kernel_dir+"network_"+key+".py"
+    if not os.path.exists(file_name):
+        source = KernelSource(network)
+        try:
+            os.makedirs(kernel_dir,exist_ok=True)
+            # Temporary file + rename: safe with several runs in parallel
+            tmp_file = file_name+".%d.tmp" % os.getpid()
+            with open(tmp_file,"w") as f:
+                f.write(source)
+            os.replace(tmp_file,file_name)
+        except OSError:
+            # Read-only installation: compile in memory, without disk cache
+            module = {"np": np}
+            exec(compile(source,"<network_"+key+">","exec"),module)
+            return njit(module["dYdt"]), njit(module["Jacobian"])
+    name = "PRyM_network_"+key
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name,file_name)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        sys.modules[name] = module
+    module = sys.modules[name]
+    return njit(cache=True)(module.dYdt), njit(cache=True)(module.Jacobian)
+
+class CompiledNetwork(object):
+    # Same interface as ReactionNetwork, with generated Numba kernels
+    def __init__(self,network):
+        self.n = network.n
+        self.kernel_dYdt, self.kernel_Jacobian = LoadKernels(network)
+
+    def dYdt(self,Y,state):
+        T_t, rhoBBN, nTOp_frwrd, nTOp_bkwrd, frwrd, bkwrd = state
+        return self.kernel_dYdt(Y,frwrd,bkwrd,rhoBBN,nTOp_frwrd,nTOp_bkwrd)
+
+    def Jacobian(self,Y,state):
+        T_t, rhoBBN, nTOp_frwrd, nTOp_bkwrd, frwrd, bkwrd = state
+        return self.kernel_Jacobian(Y,frwrd,bkwrd,rhoBBN,nTOp_frwrd,nTOp_bkwrd)
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+from scipy.interpolate import make_interp_spline
+import PRyM.PRyM_init as PRyMini
+
+##############################
+# Array-backed rate database #
+##############################
+# All 63 reactions in network order: 12 key reactions first, then the other ones
+reaction_names = PRyMini.key_reactions+PRyMini.other_reactions
+# Reactions interpolated with quadratic splines (linear otherwise)
+quadratic_reactions = ["dntg","ttann","He3nag","He3tad","He3tanp","Li7taan","Li7He3aanp","Li8dLi7t","Be7taanp",
+                       "Be7He3aapp","Li6nta","He3tLi6g","anpLi6g","Li6nLi7g","Li6dLi7p","Li6dBe7n","Li7nLi8g",
+                       "Li7dLi8p","Li8paan","annHe6g","ppndp","Li7taann"]
+# Stacked tables, rebuilt only if some table in PRyM_init changes (e.g. ReloadKeyRates)
+rate_db = {}
+
+def TableSources(name):
+    # Objects the tables of reaction name come from: arrays set by hand in PRyM_init, or else the
+    # table cached by PRyM_init.RateTable (its __getattr__ returns a new view at every access)
+    fields = vars(PRyMini)
+    return tuple(fields[name+"_"+field] if name+"_"+field in fields else PRyMini.RateTable(name) for field in PRyMini.rate_fields)
+
+def RateDatabase(names):
+    # T9 grid, (n_reactions x n_T9) medians and log-sigmas, detailed balance coefficients
+    sources = [TableSources(name) for name in names]
+    key = tuple(names)
+    if key in rate_db and all(a is b for old, new in zip(rate_db[key]["sources"],sources) for a, b in zip(old,new)):
+        return rate_db[key]
+    tables = [(getattr(PRyMini,name+"_T9"),getattr(PRyMini,name+"_median"),getattr(PRyMini,name+"_expsigma")) for name in names]
+    T9 = tables[0][0]
+    if not all(np.array_equal(table[0],T9) for table in tables):
+        raise ValueError("Nuclear rates must be tabulated on the same T9 grid.")
+    db = {"sources": sources, "T9": np.asarray(T9)}
+    db["median"] = np.array([table[1] for table in tables])
+    db["logsigma"] = np.log(np.array([table[2] for table in tables]))
+    db["alpha"] = np.array([getattr(PRyMini,"alpha_"+name) for name in names])
+    db["beta"] = np.array([getattr(PRyMini,"beta_"+name) for name in names])
+    db["gamma"] = np.array([getattr(PRyMini,"gamma_"+name) for name in names])
+    db["quadratic"] = np.array([name in quadratic_reactions for name in names])
+    rate_db[key] = db
+    return db
+
+def WeightVector(names):
+    # Gaussian weights p_R of PRyM_init, in units of log-sigma
+    return np.array([getattr(PRyMini,"p_"+name) for name in names],dtype=float)
+
+def NPShiftVector(names):
+    # NP shifts NP_delta_R of PRyM_init, in units of median rates
+    return np.array([getattr(PRyMini,"NP_delta_"+name) for name in names],dtype=float)
+
+class RateEvaluator(object):
+    # All forward and backward rates at one T9: one index search on the shared T9 grid,
+    # same interpolation as interp1d(kind='linear'/'quadratic',fill_value="extrapolate").
+    # Reverse rates are not tabulated: detailed balance on the interpolated forward rates costs one
+    # exp per call (less than a second interpolation), and keeps the exact T9 dependence of
+    # exp(gamma/T9), steep at low T9, instead of interpolating it between grid points.
+    def __init__(self,T9_grid,mu,quadratic,alpha,beta,gamma):
+        self.n = len(mu)
+        self.lin = np.flatnonzero(~quadratic)
+        self.quad = np.flatnonzero(quadratic)
+        self.x = T9_grid
+        self.y = mu[self.lin]
+        self.slope = (self.y[:,1:]-self.y[:,:-1])/(T9_grid[1:]-T9_grid[:-1])
+        self.spline = make_interp_spline(T9_grid,mu[self.quad].T,k=2) if len(self.quad) else None
+        # Detailed balance: ln(alpha*T9**beta*exp(gamma/T9)) = [1,ln(T9),1/T9].balance
+        self.balance = np.array([np.log(alpha),beta,gamma])
+
+    def __call__(self,T9):
+        f = np.empty(self.n)
+        i = min(max(np.searchsorted(self.x,T9),1),len(self.x)-1)-1
+        f[self.lin] = self.slope[:,i]*(T9-self.x[i])+self.y[:,i]
+        if self.spline is not None:
+            f[self.quad] = self.spline(T9)
+        # Reverse rates from detailed balance
+        b = np.exp(np.dot((1.,np.log(T9),1./T9),self.balance))*f
+        return f, b
+
+def ForwardRate(i):
+    def frwrd(self,T):
+        return self.Rates(T)[0][i]
+    return frwrd
+
+def BackwardRate(i):
+    def bkwrd(self,T):
+        return self.Rates(T)[1][i]
+    return bkwrd
+
+class NuclearRates(object):
+    # Rates of the reactions listed in names, for weights p_nucl (default: PRyM_init values)
+    names = reaction_names
+    def __init_subclass__(cls,**kwargs):
+        # <name>_frwrd(T) and <name>_bkwrd(T) [T in K] for each reaction of the network
+        super().__init_subclass__(**kwargs)
+        for i, name in enumerate(cls.names):
+            setattr(cls,name+"_frwrd",ForwardRate(i))
+            setattr(cls,name+"_bkwrd",BackwardRate(i))
+
+    def __init__(self,*p_nucl):
+        db = RateDatabase(self.names)
+        if(len(p_nucl) == 0):
+            p_vec = WeightVector(self.names)
+        elif(len(p_nucl) == 1 and np.ndim(p_nucl[0]) == 1):
+            p_vec = np.asarray(p_nucl[0],dtype=float)
+        else:
+            p_vec = np.array(p_nucl,dtype=float)
+        if(len(p_vec) != len(self.names)):
+            raise ValueError("Expected %d nuclear rate weights, got %d." % (len(self.names),len(p_vec)))
+        mu = db["median"]*np.exp(p_vec[:,None]*db["logsigma"])
+        if(PRyMini.NP_nuclear_flag):
+            mu += NPShiftVector(self.names)[:,None]*db["median"]
+        self.T9_grid = db["T9"]
+        self.mu = mu
+        self.evaluator = RateEvaluator(db["T9"],mu,db["quadratic"],db["alpha"],db["beta"],db["gamma"])
+        self.T_last = None
+
+    def Rates(self,T):
+        # Vectors of forward and backward rates at T [K], kept until T changes
+        if T != self.T_last:
+            self.rates_last = self.evaluator(T*1.e-9)
+            self.T_last = T
+        return self.rates_last
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+import os
+import json
+import numpy as np
+
+#####################################
+# Binary store for PRyMrates tables #
+#####################################
+# Text files in PRyMrates/ are the source of truth. Each one is mirrored by a .npy file
+# in PRyMrates/bin/ (same sub-directory structure), with a sidecar <name>.npy.meta holding
+# size and modification time of the text file it was converted from: a binary copy is only
+# used if these match, and is regenerated otherwise.
+# Bump whenever the conversion changes
+tables_version = 1
+
+def BinaryPath(txt_file):
+    # PRyMrates/<sub>/<name>.txt --> PRyMrates/bin/<sub>/<name>.npy
+    head, sep, tail = txt_file.rpartition("/PRyMrates/")
+    if not sep or tail.startswith("bin/"):
+        return None
+    return head+sep+"bin/"+os.path.splitext(tail)[0]+".npy"
+
+def ReadStamp(npy_file):
+    try:
+        with open(npy_file+".meta") as f:
+            meta = json.load(f)
+        return meta["stamp"] if meta.get("version") == tables_version else None
+    except (OSError,ValueError,KeyError,TypeError):
+        return None
+
+def WriteBinary(npy_file,table,stamp):
+    # Temporary files + rename, table before its sidecar: one file per table, so that
+    # several processes converting at once never overwrite each other's entries
+    os.makedirs(os.path.dirname(npy_file),exist_ok=True)
+    tmp_file = npy_file+".%d.tmp.npy" % os.getpid()
+    np.save(tmp_file,table)
+    os.replace(tmp_file,npy_file)
+    tmp_file = npy_file+".meta.%d.tmp" % os.getpid()
+    with open(tmp_file,"w") as f:
+        json.dump({"version": tables_version, "stamp": stamp},f)
+    os.replace(tmp_file,npy_file+".meta")
+
+def LoadTable(txt_file,unpack=False):
+    # Drop-in replacement of np.loadtxt(txt_file,unpack=unpack)
+    import PRyM.PRyM_init as PRyMini # flags read at call time
+    npy_file = BinaryPath(txt_file)
+    if not getattr(PRyMini,"binary_tables_flag",False) or npy_file is None:
+        return np.loadtxt(txt_file,unpack=unpack)
+    txt_stat = os.stat(txt_file)
+    stamp = [txt_stat.st_size,txt_stat.st_mtime_ns]
+    table = None
+    if ReadStamp(npy_file) == stamp:
+        try:
+            table = np.load(npy_file,mmap_mode="r" if getattr(PRyMini,"mmap_tables_flag",False) else None)
+        except (OSError,ValueError):
+            table = None
+    if table is None:
+        table = np.loadtxt(txt_file)
+        try:
+            WriteBinary(npy_file,table,stamp)
+        except OSError:
+            pass # read-only installation: keep using text files
+    return table.T if unpack else table
+
+def ConvertTables(rates_dir):
+    # Convert (or refresh) all tables in thermo/, nuclear/ and nTOp/ of a PRyMrates directory
+    import PRyM.PRyM_init as PRyMini
+    rates_dir = os.path.abspath(rates_dir)
+    binary_tables_flag = PRyMini.binary_tables_flag
+    PRyMini.binary_tables_flag = True
+    converted = []
+    for sub_dir in ["thermo","nuclear","nTOp"]:
+        for root, dirs, files in os.walk(os.path.join(rates_dir,sub_dir)):
+            for name in sorted(files):
+                if name.endswith(".txt"):
+                    LoadTable(os.path.join(root,name))
+                    converted.append(os.path.join(root,name))
+    PRyMini.binary_tables_flag = binary_tables_flag
+    return converted
+
+if __name__ == "__main__":
+    import sys
+    rates_dir = os.path.abspath(sys.argv[1] if len(sys.argv) > 1 else "PRyMrates")
+    print("Converted %d tables to binary format." % len(ConvertTables(rates_dir)))
@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 import numpy as np
 from scipy.integrate import quad
-from scipy.interpolate import interp1d
+from scipy.interpolate import interp1d, CubicSpline
 from scipy.special import kv
 import PRyM.PRyM_init as PRyMini
+import PRyM.PRyM_tables as PRyMtables
 if(PRyMini.numba_flag):
     from numba import njit
 
@@ -12,28 +13,96 @@ if(PRyMini.verbose_flag):
     print("PRyM_thermo.py: Loading SM rates for thermal bath")
     print("Natural units adopted here. Temperatures in MeV.")
  
+######################################
+# Interpolation on log-uniform grids #
+######################################
+# Linear interpolation (and extrapolation, as interp1d) of several columns sharing one grid.
+# Index found in O(1): buckets of width min(dlnx) in ln(x) store the grid index at their
+# left edge, followed by at most a few forward steps (handles non-uniform end points too).
+def log_grid_interp(x,lnx0,dlnx,bucket,xp,fp):
+    k = min(max(int((np.log(x)-lnx0)/dlnx),0),bucket.shape[0]-1)
+    i = bucket[k]
+    while i < xp.shape[0]-2 and x >= xp[i+1]:
+        i += 1
+    w = (x-xp[i])/(xp[i+1]-xp[i])
+    return fp[:,i]+(fp[:,i+1]-fp[:,i])*w
+if(PRyMini.numba_flag):
+    log_grid_interp = njit(log_grid_interp)
+class LogGridInterp(object):
+    def __init__(self,x,y_cols):
+        order = np.argsort(x)
+        self.xp = np.ascontiguousarray(np.asarray(x,dtype=float)[order])
+        self.fp = np.ascontiguousarray(np.asarray(y_cols,dtype=float)[:,order])
+        lnxp = np.log(self.xp)
+        self.lnx0, self.dlnx = lnxp[0], np.min(np.diff(lnxp))
+        n_bucket = int(np.ceil((lnxp[-1]-lnxp[0])/self.dlnx))+1
+        bucket_edges = np.exp(self.lnx0+self.dlnx*np.arange(n_bucket))
+        # one step back to be safe against rounding at bucket edges
+        self.bucket = np.clip(np.searchsorted(self.xp,bucket_edges,side='right')-2,0,len(self.xp)-2)
+        self.args = (self.lnx0,self.dlnx,self.bucket,self.xp,self.fp)
+    # All columns at x: shape (n_cols,) for scalar x, (n_cols,len(x)) for array x
+    def __call__(self,x):
+        if np.ndim(x) == 0:
+            return log_grid_interp(float(x),*self.args)
+        x = np.asarray(x,dtype=float)
+        i = np.clip(np.searchsorted(self.xp,x,side='right')-1,0,len(self.xp)-2)
+        w = (x-self.xp[i])/(self.xp[i+1]-self.xp[i])
+        return self.fp[:,i]+(self.fp[:,i+1]-self.fp[:,i])*w
+
+# Cubic spline of ln(y) in ln(x), x increasing: continuous first and second derivatives
+# (and extrapolation) for background quantities, with analytic derivatives
+class LogLogSpline(object):
+    def __init__(self,x,y):
+        self.spline = CubicSpline(np.log(x),np.log(y))
+        self.dspline = self.spline.derivative()
+    def __call__(self,x):
+        return np.exp(self.spline(np.log(x)))
+    # Logarithmic derivative dln(y)/dln(x)
+    def dlog(self,x):
+        return self.dspline(np.log(x))
+    # Derivative dy/dx
+    def derivative(self,x):
+        return self(x)*self.dlog(x)/x
+
 ###########################################################
 # Standard Model matrix elements & plasma QED corrections #
 ###########################################################
 # Credit for dataset to NUDEC_BSM:
 # ArXiv:1812.05605 [JCAP 1902 (2019) 007] and ArXiv:2001.04466 [JCAP 05 (2020) 048])
 # Effect of finite electron mass in scattering matrix elements (standard value for me assumed)
-fnu_e_scat_tab = np.loadtxt(my_dir+"/PRyMrates/thermo/"+"nue_scatt.txt")
-fnu_e_scat = interp1d(fnu_e_scat_tab[:,0],fnu_e_scat_tab[:,1], bounds_error=False, fill_value="extrapolate", kind='linear')
-fnu_mu_scat_tab = np.loadtxt(my_dir+"/PRyMrates/thermo/"+"numu_scatt.txt")
-fnu_mu_scat = interp1d(fnu_mu_scat_tab[:,0],fnu_mu_scat_tab[:,1], bounds_error=False, fill_value="extrapolate", kind='linear')
+fnu_e_scat_tab = PRyMtables.LoadTable(my_dir+"/PRyMrates/thermo/"+"nue_scatt.txt")
+fnu_mu_scat_tab = PRyMtables.LoadTable(my_dir+"/PRyMrates/thermo/"+"numu_scatt.txt")
 # Effect of finite electron mass in annihilation matrix elements (standard value for me assumed)
-fnu_e_ann_tab = np.loadtxt(my_dir+"/PRyMrates/thermo/"+"nue_ann.txt")
-fnu_e_ann = interp1d(fnu_e_ann_tab[:,0],fnu_e_ann_tab[:,1], bounds_error=False, fill_value="extrapolate", kind='linear')
-fnu_mu_ann_tab = np.loadtxt(my_dir+"/PRyMrates/thermo/"+"numu_ann.txt")
-fnu_mu_ann = interp1d(fnu_mu_ann_tab[:,0],fnu_mu_ann_tab[:,1], bounds_error=False, fill_value="extrapolate", kind='linear')
+fnu_e_ann_tab = PRyMtables.LoadTable(my_dir+"/PRyMrates/thermo/"+"nue_ann.txt")
+fnu_mu_ann_tab = PRyMtables.LoadTable(my_dir+"/PRyMrates/thermo/"+"numu_ann.txt")
+# Common temperature grid: columns [e scatt, mu scatt, e ann, mu ann]
+fnu_interp = LogGridInterp(fnu_e_scat_tab[:,0],[fnu_e_scat_tab[:,1],fnu_mu_scat_tab[:,1],fnu_e_ann_tab[:,1],fnu_mu_ann_tab[:,1]])
+def fnu_e_scat(T):
+    return fnu_interp(T)[0]
+def fnu_mu_scat(T):
+    return fnu_interp(T)[1]
+def fnu_e_ann(T):
+    return fnu_interp(T)[2]
+def fnu_mu_ann(T):
+    return fnu_interp(T)[3]
+# Temperature derivatives of matrix-element factors (Jacobian of background equations)
+dfnu_e_scat_dT = interp1d(fnu_e_scat_tab[:,0],np.gradient(fnu_e_scat_tab[:,1],fnu_e_scat_tab[:,0]), bounds_error=False, fill_value="extrapolate", kind='linear')
+dfnu_mu_scat_dT = interp1d(fnu_mu_scat_tab[:,0],np.gradient(fnu_mu_scat_tab[:,1],fnu_mu_scat_tab[:,0]), bounds_error=False, fill_value="extrapolate", kind='linear')
+dfnu_e_ann_dT = interp1d(fnu_e_ann_tab[:,0],np.gradient(fnu_e_ann_tab[:,1],fnu_e_ann_tab[:,0]), bounds_error=False, fill_value="extrapolate", kind='linear')
+dfnu_mu_ann_dT = interp1d(fnu_mu_ann_tab[:,0],np.gradient(fnu_mu_ann_tab[:,1],fnu_mu_ann_tab[:,0]), bounds_error=False, fill_value="extrapolate", kind='linear')
 # QED plasma corrections (standard value for alphaem and me assumed)
-P_QED_tab = np.loadtxt(my_dir+"/PRyMrates/thermo/"+"QED_P_int.txt")
-PofT = interp1d(P_QED_tab[:,0],P_QED_tab[:,1]+P_QED_tab[:,2], bounds_error=False, fill_value="extrapolate", kind='linear')
-dPdT_QED_tab = np.loadtxt(my_dir+"/PRyMrates/thermo/"+"QED_dP_intdT.txt")
-dPdT = interp1d(dPdT_QED_tab[:,0],dPdT_QED_tab[:,1]+dPdT_QED_tab[:,2], bounds_error=False, fill_value="extrapolate", kind='linear')
-d2PdT2_QED_tab = np.loadtxt(my_dir+"/PRyMrates/thermo/"+"QED_d2P_intdT2.txt")
-d2PdT2 = interp1d(d2PdT2_QED_tab[:,0],d2PdT2_QED_tab[:,1]+d2PdT2_QED_tab[:,2], bounds_error=False, fill_value="extrapolate", kind='linear')
+P_QED_tab = PRyMtables.LoadTable(my_dir+"/PRyMrates/thermo/"+"QED_P_int.txt")
+dPdT_QED_tab = PRyMtables.LoadTable(my_dir+"/PRyMrates/thermo/"+"QED_dP_intdT.txt")
+d2PdT2_QED_tab = PRyMtables.LoadTable(my_dir+"/PRyMrates/thermo/"+"QED_d2P_intdT2.txt")
+# Common temperature grid: columns [P, dP/dT, d2P/dT2]
+QED_interp = LogGridInterp(P_QED_tab[:,0],[P_QED_tab[:,1]+P_QED_tab[:,2],dPdT_QED_tab[:,1]+dPdT_QED_tab[:,2],d2PdT2_QED_tab[:,1]+d2PdT2_QED_tab[:,2]])
+def PofT(T):
+    return QED_interp(T)[0]
+def dPdT(T):
+    return QED_interp(T)[1]
+def d2PdT2(T):
+    return QED_interp(T)[2]
+d3PdT3 = interp1d(d2PdT2_QED_tab[:,0],np.gradient(d2PdT2_QED_tab[:,1]+d2PdT2_QED_tab[:,2],d2PdT2_QED_tab[:,0]), bounds_error=False, fill_value="extrapolate", kind='linear')
 
 ##################
 # Photon species #
@@ -56,7 +125,7 @@ if(PRyMini.numba_flag):
 else:
     def rho_e_int(E,Tg):
         return E**2*(E**2-(PRyMini.me/Tg)**2)**0.5/(np.exp(E)+1.)
-def rho_e(Tg):
+def rho_e_quad(Tg):
     if Tg < PRyMini.me/30.:
         return 0.0
     else:
@@ -70,7 +139,7 @@ if(PRyMini.numba_flag):
 else:
     def drho_e_dT_int(E,Tg):
         return E**3*(E**2-(PRyMini.me/Tg)**2)**0.5/np.cosh(E/2.0)**2
-def drho_e_dT(Tg):
+def drho_e_dT_quad(Tg):
     if Tg < PRyMini.me/30.:
         return 0.0
     else:
@@ -84,13 +153,143 @@ if(PRyMini.numba_flag):
 else:
     def p_e_int(E,Tg):
         return (E**2-(PRyMini.me/Tg)**2)**1.5/(np.exp(E)+1.)
-def p_e(Tg):
+def p_e_quad(Tg):
     if Tg < PRyMini.me/30.:
         return 0.0
     else:
         res_int = quad(p_e_int,PRyMini.me/Tg,100.,args=(Tg),epsabs=1e-12,epsrel=1e-12)[0]
         return 4./(6*np.pi**2)*Tg**4*res_int
 
+#################################
+# Vectorized e+- thermodynamics #
+#################################
+# Fixed-order Gauss-Legendre quadrature with nodes shared by all temperatures.
+# With E = x + s^2 the integrands are smooth in s (no square-root endpoint),
+# three panels on s in [0,10] with 16 nodes each: relative error ~ 2e-12 for x in [1e-3, 30].
+s_GL, w_GL = [], []
+for s_a, s_b in [(0.,2.),(2.,5.),(5.,10.)]:
+    x_GL_ref, w_GL_ref = np.polynomial.legendre.leggauss(16)
+    s_GL.append(0.5*(s_b-s_a)*x_GL_ref+0.5*(s_b+s_a))
+    w_GL.append(0.5*(s_b-s_a)*w_GL_ref)
+s_GL, w_GL = np.concatenate(s_GL), np.concatenate(w_GL)
+# Dimensionless integrals I_rho, I_p, I_drho for an array of x = me/Tg
+def e_integrals_vec(x):
+    x = np.asarray(x,dtype=float)[...,np.newaxis]
+    E = x+s_GL**2
+    q = np.sqrt(2.*x+s_GL**2) # sqrt(E^2-x^2)/s
+    fFD = 1./(np.exp(E)+1.)
+    I_rho = (2.*s_GL**2*E**2*q*fFD)@w_GL
+    I_p = (2.*s_GL**4*q**3*fFD)@w_GL
+    I_drho = (2.*s_GL**2*E**3*q/np.cosh(E/2.)**2)@w_GL
+    return I_rho, I_p, I_drho
+# Same conventions as the scalar functions: zero for Tg < me/30
+def rho_e_vec(Tg):
+    Tg = np.asarray(Tg,dtype=float)
+    x = PRyMini.me/Tg
+    return np.where(x > 30.,0.,4./(2*np.pi**2)*Tg**4*e_integrals_vec(np.minimum(x,30.))[0])
+def p_e_vec(Tg):
+    Tg = np.asarray(Tg,dtype=float)
+    x = PRyMini.me/Tg
+    return np.where(x > 30.,0.,4./(6*np.pi**2)*Tg**4*e_integrals_vec(np.minimum(x,30.))[1])
+def drho_e_dT_vec(Tg):
+    Tg = np.asarray(Tg,dtype=float)
+    x = PRyMini.me/Tg
+    return np.where(x > 30.,0.,1./(2*np.pi**2)*Tg**3*e_integrals_vec(np.minimum(x,30.))[2])
+def s_e_vec(Tg):
+    Tg = np.asarray(Tg,dtype=float)
+    x = PRyMini.me/Tg
+    I_rho, I_p = e_integrals_vec(np.minimum(x,30.))[:2]
+    return np.where(x > 30.,0.,Tg**3*(4./(2*np.pi**2)*I_rho+4./(6*np.pi**2)*I_p))
+
+###################################
+# Tabulated e+- equation of state #
+###################################
+# Dimensionless integrals I_rho, I_p, I_drho and e+- entropy s_e/T^3 tabulated vs x = me/Tg
+# on a uniform grid in ln(x), with x in [x_EOS_min, x_EOS_max] (independent of me value).
+# Cubic spline in (ln x, ln I): relative error vs quad (epsrel=1e-12) below 1e-9 on the whole range.
+# Outside the table: quad for x < x_EOS_min (Tg > 511 MeV), zero for x > x_EOS_max as above.
+x_EOS_min, x_EOS_max, n_EOS = 1.e-3, 30., 2001
+EOS_file = my_dir+"/PRyMrates/thermo/"+"e_EOS_tab.txt"
+def ComputeEOSTable():
+    x_vec = np.exp(np.linspace(np.log(x_EOS_min),np.log(x_EOS_max),n_EOS))
+    I_rho, I_p, I_drho = e_integrals_vec(x_vec)
+    s_e = 4./(2*np.pi**2)*I_rho+4./(6*np.pi**2)*I_p
+    return np.c_[x_vec,I_rho,I_p,I_drho,s_e]
+if(PRyMini.tab_eos_flag):
+    try:
+        EOS_tab = PRyMtables.LoadTable(EOS_file)
+    except OSError:
+        if(PRyMini.verbose_flag):
+            print("Building e+- equation of state table (only once).")
+        EOS_tab = ComputeEOSTable()
+        np.savetxt(EOS_file,EOS_tab,header="x = me/T    I_rho    I_p    I_drho    s_e/T^3")
+    lnx_EOS = np.log(EOS_tab[:,0])
+    lnx_EOS_0, dlnx_EOS = lnx_EOS[0], lnx_EOS[1]-lnx_EOS[0]
+    # Piecewise cubic coefficients, shape (4 columns, 4 powers, n_EOS-1 intervals)
+    EOS_coeffs = np.ascontiguousarray([CubicSpline(lnx_EOS,np.log(EOS_tab[:,i])).c for i in range(1,5)])
+def eos_interp(lnx,col,coeffs,lnx0,dlnx):
+    i = min(int((lnx-lnx0)/dlnx),coeffs.shape[2]-1)
+    u = lnx-lnx0-i*dlnx
+    return np.exp(((coeffs[col,0,i]*u+coeffs[col,1,i])*u+coeffs[col,2,i])*u+coeffs[col,3,i])
+# dln(I)/dln(x) from the same spline
+def eos_interp_slope(lnx,col,coeffs,lnx0,dlnx):
+    i = min(int((lnx-lnx0)/dlnx),coeffs.shape[2]-1)
+    u = lnx-lnx0-i*dlnx
+    return (3.*coeffs[col,0,i]*u+2.*coeffs[col,1,i])*u+coeffs[col,2,i]
+if(PRyMini.numba_flag):
+    eos_interp = njit(eos_interp)
+    eos_interp_slope = njit(eos_interp_slope)
+# d^2rho_e/dT^2 via finite difference of quad result
+def d2rho_e_dT2_quad(Tg):
+    dToT = 1.e-4
+    return (drho_e_dT_quad((1.+dToT)*Tg)-drho_e_dT_quad((1.-dToT)*Tg))/(2.*dToT*Tg)
+
+if(PRyMini.tab_eos_flag):
+    def rho_e(Tg):
+        x = PRyMini.me/Tg
+        if x > x_EOS_max:
+            return 0.0
+        elif x < x_EOS_min:
+            return rho_e_quad(Tg)
+        return 4./(2*np.pi**2)*Tg**4*eos_interp(np.log(x),0,EOS_coeffs,lnx_EOS_0,dlnx_EOS)
+    def p_e(Tg):
+        x = PRyMini.me/Tg
+        if x > x_EOS_max:
+            return 0.0
+        elif x < x_EOS_min:
+            return p_e_quad(Tg)
+        return 4./(6*np.pi**2)*Tg**4*eos_interp(np.log(x),1,EOS_coeffs,lnx_EOS_0,dlnx_EOS)
+    def drho_e_dT(Tg):
+        x = PRyMini.me/Tg
+        if x > x_EOS_max:
+            return 0.0
+        elif x < x_EOS_min:
+            return drho_e_dT_quad(Tg)
+        return 1./(2*np.pi**2)*Tg**3*eos_interp(np.log(x),2,EOS_coeffs,lnx_EOS_0,dlnx_EOS)
+    # e+- entropy density
+    def s_e(Tg):
+        x = PRyMini.me/Tg
+        if x > x_EOS_max:
+            return 0.0
+        elif x < x_EOS_min:
+            return (rho_e_quad(Tg)+p_e_quad(Tg))/Tg
+        return Tg**3*eos_interp(np.log(x),3,EOS_coeffs,lnx_EOS_0,dlnx_EOS)
+    # d^2rho_e/dT^2 = drho_e_dT/T*(3-dlnI_drho/dlnx)
+    def d2rho_e_dT2(Tg):
+        x = PRyMini.me/Tg
+        if x > x_EOS_max:
+            return 0.0
+        elif x < x_EOS_min:
+            return d2rho_e_dT2_quad(Tg)
+        return drho_e_dT(Tg)/Tg*(3.-eos_interp_slope(np.log(x),2,EOS_coeffs,lnx_EOS_0,dlnx_EOS))
+else:
+    rho_e, p_e, drho_e_dT, d2rho_e_dT2 = rho_e_quad, p_e_quad, drho_e_dT_quad, d2rho_e_dT2_quad
+    def s_e(Tg):
+        return (rho_e_quad(Tg)+p_e_quad(Tg))/Tg
+# dp_e/dT = (rho_e+p_e)/T, i.e. entropy density at zero chemical potential
+def dp_e_dT(Tg):
+    return s_e(Tg)
+
 ####################
 # Neutrino species #
 ####################
@@ -110,12 +309,14 @@ def drho_nu_dT(Tnu):
 ##########################
 # Pauli blocking for relativistic fermions as in [JCAP 05 (2020) 048]
 fannFD, fscatFD = 0.884, 0.829
+def f_nu(T1,T2,fnu_ann_T1,fnu_scat_T1):
+    return 32.*fannFD*(T1**9-T2**9)*fnu_ann_T1+56.*fscatFD*fnu_scat_T1*T1**4*T2**4*(T1-T2)
 def f_nu_e(T1,T2):
-    res = 32.*fannFD*(T1**9-T2**9)*fnu_e_ann(T1)+56.*fscatFD*fnu_e_scat(T1)*T1**4*T2**4*(T1-T2)
-    return res
+    fnu_T1 = fnu_interp(T1)
+    return f_nu(T1,T2,fnu_T1[2],fnu_T1[0])
 def f_nu_mu(T1,T2):
-    res = 32.*fannFD*(T1**9-T2**9)*fnu_mu_ann(T1)+56.*fscatFD*fnu_mu_scat(T1)*T1**4*T2**4*(T1-T2)
-    return res
+    fnu_T1 = fnu_interp(T1)
+    return f_nu(T1,T2,fnu_T1[3],fnu_T1[1])
 def f_g(T1,T2):
     res = 32.*fannFD*(T1**9-T2**9)+56.*fscatFD*T1**4*T2**4*(T1-T2)
     return res
@@ -124,6 +325,41 @@ def delta_rho_nue(Tg,Tnue,Tnumu):
     return PRyMini.MeV_to_secm1*PRyMini.GF**2/np.pi**5*(4.*(PRyMini.geL**2+PRyMini.geR**2)*f_nu_e(Tg,Tnue)+2.*f_g(Tnumu,Tnue))
 def delta_rho_numu(Tg,Tnue,Tnumu):
     return PRyMini.MeV_to_secm1*PRyMini.GF**2/np.pi**5*(4.*(PRyMini.gmuL**2+PRyMini.gmuR**2)*f_nu_mu(Tg,Tnue)-f_g(Tnumu,Tnue))
+# Both collision terms above from a single table lookup
+def delta_rho_nu_all(Tg,Tnue,Tnumu):
+    fnu_Tg = fnu_interp(Tg)
+    norm = PRyMini.MeV_to_secm1*PRyMini.GF**2/np.pi**5
+    f_g_T = f_g(Tnumu,Tnue)
+    delta_e = norm*(4.*(PRyMini.geL**2+PRyMini.geR**2)*f_nu(Tg,Tnue,fnu_Tg[2],fnu_Tg[0])+2.*f_g_T)
+    delta_mu = norm*(4.*(PRyMini.gmuL**2+PRyMini.gmuR**2)*f_nu(Tg,Tnue,fnu_Tg[3],fnu_Tg[1])-f_g_T)
+    return delta_e, delta_mu
+# All QED and matrix-element factors at Tg: [P, dP/dT, d2P/dT2, fnu_e_scat, fnu_mu_scat, fnu_e_ann, fnu_mu_ann]
+def thermo_factors(Tg):
+    return np.concatenate((QED_interp(Tg),fnu_interp(Tg)))
+# Partial derivatives of the above wrt T1 and T2
+def df_nu_e(T1,T2):
+    d1 = 32.*fannFD*(9.*T1**8*fnu_e_ann(T1)+(T1**9-T2**9)*dfnu_e_ann_dT(T1))+56.*fscatFD*T2**4*(dfnu_e_scat_dT(T1)*T1**4*(T1-T2)+fnu_e_scat(T1)*(5.*T1**4-4.*T1**3*T2))
+    d2 = -288.*fannFD*T2**8*fnu_e_ann(T1)+56.*fscatFD*fnu_e_scat(T1)*T1**4*(4.*T1*T2**3-5.*T2**4)
+    return d1,d2
+def df_nu_mu(T1,T2):
+    d1 = 32.*fannFD*(9.*T1**8*fnu_mu_ann(T1)+(T1**9-T2**9)*dfnu_mu_ann_dT(T1))+56.*fscatFD*T2**4*(dfnu_mu_scat_dT(T1)*T1**4*(T1-T2)+fnu_mu_scat(T1)*(5.*T1**4-4.*T1**3*T2))
+    d2 = -288.*fannFD*T2**8*fnu_mu_ann(T1)+56.*fscatFD*fnu_mu_scat(T1)*T1**4*(4.*T1*T2**3-5.*T2**4)
+    return d1,d2
+def df_g(T1,T2):
+    d1 = 288.*fannFD*T1**8+56.*fscatFD*T2**4*(5.*T1**4-4.*T1**3*T2)
+    d2 = -288.*fannFD*T2**8+56.*fscatFD*T1**4*(4.*T1*T2**3-5.*T2**4)
+    return d1,d2
+# Gradients of collision terms wrt (Tg,Tnue,Tnumu)
+def ddelta_rho_nue(Tg,Tnue,Tnumu):
+    norm = PRyMini.MeV_to_secm1*PRyMini.GF**2/np.pi**5
+    d1e,d2e = df_nu_e(Tg,Tnue)
+    d1g,d2g = df_g(Tnumu,Tnue)
+    return norm*4.*(PRyMini.geL**2+PRyMini.geR**2)*d1e, norm*(4.*(PRyMini.geL**2+PRyMini.geR**2)*d2e+2.*d2g), norm*2.*d1g
+def ddelta_rho_numu(Tg,Tnue,Tnumu):
+    norm = PRyMini.MeV_to_secm1*PRyMini.GF**2/np.pi**5
+    d1mu,d2mu = df_nu_mu(Tg,Tnue)
+    d1g,d2g = df_g(Tnumu,Tnue)
+    return norm*4.*(PRyMini.gmuL**2+PRyMini.gmuR**2)*d1mu, norm*(4.*(PRyMini.gmuL**2+PRyMini.gmuR**2)*d2mu-d2g), -norm*d1g
 
 #######################
 # Standard Model (SM) #
@@ -161,12 +397,98 @@ def delta_rho_NP(Tg,Tnue,Tnumu,T_NP):
 # Plasma entropy density #
 ##########################
 def spl(Tg):
-    rho_pl = rho_g(Tg)+rho_e(Tg)
-    p_pl = rho_g(Tg)/3.+p_e(Tg)
-    delta_rho_QED = Tg*dPdT(Tg)-PofT(Tg)
-    delta_p_QED = PofT(Tg)
-    spl_T = (rho_pl+p_pl+(delta_rho_QED+delta_p_QED))/Tg
+    # (rho+p)/T: photons, e+- and QED corrections (delta_rho_QED+delta_p_QED = Tg*dPdT)
+    spl_T = 4.*rho_g(Tg)/(3.*Tg)+s_e(Tg)+dPdT(Tg)
     # NP species in equilibrium with e+-, gamma (i.e. SM plasma)
     if(PRyMini.NP_e_flag):
         spl_T += (rho_NP(Tg)+p_NP(Tg))/Tg
     return spl_T
+# dspl/dT from ds/dT = (drho/dT)/T for each species at zero chemical potential
+def dspl_dT(Tg):
+    dspl_T = 4.*rho_g(Tg)/Tg**2+drho_e_dT(Tg)/Tg+d2PdT2(Tg)
+    if(PRyMini.NP_e_flag):
+        dspl_T += drho_NP_dT(Tg)/Tg
+    return dspl_T
+
+# Plasma entropy density for an array of temperatures
+def spl_vec(Tg):
+    Tg = np.asarray(Tg,dtype=float)
+    spl_T = 4.*rho_g(Tg)/(3.*Tg)+s_e_vec(Tg)+dPdT(Tg)
+    if(PRyMini.NP_e_flag):
+        spl_T += np.vectorize(lambda T: (rho_NP(T)+p_NP(T))/T)(Tg)
+    return spl_T
+def dspl_dT_vec(Tg):
+    Tg = np.asarray(Tg,dtype=float)
+    dspl_T = 4.*rho_g(Tg)/Tg**2+drho_e_dT_vec(Tg)/Tg+d2PdT2(Tg)
+    if(PRyMini.NP_e_flag):
+        dspl_T += np.vectorize(lambda T: drho_NP_dT(T)/T)(Tg)
+    return dspl_T
+
+##################################################
+# Compiled kernel for SM background temperatures #
+##################################################
+# Constants read at call time, so that changes in PRyM_init after import are picked up
+def BackgroundConsts():
+    return np.array([PRyMini.me,PRyMini.DeltaNeff,PRyMini.MeV_to_secm1,PRyMini.Mpl,PRyMini.GF,
+                     PRyMini.geL**2+PRyMini.geR**2,PRyMini.gmuL**2+PRyMini.gmuR**2,fannFD,fscatFD])
+# (dTg/dt, dTnu/dt) for SM species, with Tnue = Tnumu = Tnu as in PRyM_main
+# QED and fnu tables passed as LogGridInterp.args tuples
+def dTdt_SM_kernel(Tg,Tnu,consts,EOS_coeffs,lnx0,dlnx,QED_args,fnu_args):
+    me, DeltaNeff, MeV_to_secm1, Mpl, GF, ceL, cmuL, fann, fscat = consts
+    # e+- species (vanishing for Tg < me/30), no quad fallback above the EOS table
+    x = me/Tg
+    if x > 30.:
+        rho_e_T, p_e_T, drho_e_dT_T = 0., 0., 0.
+    elif x < x_EOS_min:
+        raise ValueError("Tg above the tabulated e+- equation of state: compiled kernel not available.")
+    else:
+        lnx = np.log(x)
+        rho_e_T = 4./(2*np.pi**2)*Tg**4*eos_interp(lnx,0,EOS_coeffs,lnx0,dlnx)
+        p_e_T = 4./(6*np.pi**2)*Tg**4*eos_interp(lnx,1,EOS_coeffs,lnx0,dlnx)
+        drho_e_dT_T = 1./(2*np.pi**2)*Tg**3*eos_interp(lnx,2,EOS_coeffs,lnx0,dlnx)
+    QED_T = log_grid_interp(Tg,QED_args[0],QED_args[1],QED_args[2],QED_args[3],QED_args[4])
+    P_T, dPdT_T, d2PdT2_T = QED_T[0], QED_T[1], QED_T[2]
+    rho_g_T = 2.*(np.pi**2/30.)*Tg**4
+    rho_nu_T = 2.*(7./8.)*(np.pi**2)/30.*Tnu**4*(1.+DeltaNeff/3.)
+    Hubble_T = MeV_to_secm1*((rho_g_T+rho_e_T-P_T+Tg*dPdT_T+3.*rho_nu_T)*8.*np.pi/(3.*Mpl**2))**0.5
+    # Collision terms: f_g(Tnu,Tnu) = 0
+    norm = MeV_to_secm1*GF**2/np.pi**5
+    f_ann = 32.*fann*(Tg**9-Tnu**9)
+    f_scat = 56.*fscat*Tg**4*Tnu**4*(Tg-Tnu)
+    fnu_T = log_grid_interp(Tg,fnu_args[0],fnu_args[1],fnu_args[2],fnu_args[3],fnu_args[4])
+    f_e = f_ann*fnu_T[2]+f_scat*fnu_T[0]
+    f_mu = f_ann*fnu_T[3]+f_scat*fnu_T[1]
+    delta_rho_nu = norm*4.*(ceL*f_e+2.*cmuL*f_mu)
+    dTgdt = (-Hubble_T*(4.*rho_g_T+3.*(rho_e_T+p_e_T)+3.*Tg*dPdT_T)-delta_rho_nu)/(4.*rho_g_T/Tg+drho_e_dT_T+Tg*d2PdT2_T)
+    dTnudt = (-12.*Hubble_T*rho_nu_T+delta_rho_nu)/(12.*rho_nu_T/Tnu)
+    return dTgdt, dTnudt
+if(PRyMini.numba_flag):
+    dTdt_SM_kernel = njit(dTdt_SM_kernel)
+# Jacobian of (dTg/dt, dTnu/dt) for SM species (Tnue = Tnumu = Tnu), with d(num/den) = (dnum-num/den*dden)/den
+def dTdt_SM_jac(Tg,Tnu):
+    rho_g_T, rho_e_T, p_e_T, rho_nu_T = rho_g(Tg), rho_e(Tg), p_e(Tg), rho_nu(Tnu)
+    drho_e_dT_T = drho_e_dT(Tg)
+    P_T, dPdT_T, d2PdT2_T = QED_interp(Tg)
+    # Gradient of the expansion rate: dH = H/(2 rho_tot) drho_tot
+    rho_tot = rho_g_T+rho_e_T-P_T+Tg*dPdT_T+3.*rho_nu_T
+    Hubble_T = PRyMini.MeV_to_secm1*(rho_tot*8.*np.pi/(3.*PRyMini.Mpl**2))**0.5
+    den_g = 4.*rho_g_T/Tg+drho_e_dT_T+Tg*d2PdT2_T
+    den_nu = 12.*rho_nu_T/Tnu
+    dH_dTg, dH_dTnu = Hubble_T/(2.*rho_tot)*den_g, Hubble_T/(2.*rho_tot)*den_nu
+    # Collision terms and their gradients
+    delta_rho_nue, delta_rho_numu = delta_rho_nu_all(Tg,Tnu,Tnu)
+    delta_rho_nu = delta_rho_nue+2.*delta_rho_numu
+    dnue, dnumu = ddelta_rho_nue(Tg,Tnu,Tnu), ddelta_rho_numu(Tg,Tnu,Tnu)
+    ddelta_dTg, ddelta_dTnu = dnue[0]+2.*dnumu[0], dnue[1]+dnue[2]+2.*(dnumu[1]+dnumu[2])
+    # Plasma
+    A = 4.*rho_g_T+3.*(rho_e_T+p_e_T)+3.*Tg*dPdT_T
+    dA_dTg = 16.*rho_g_T/Tg+3.*(drho_e_dT_T+dp_e_dT(Tg))+3.*dPdT_T+3.*Tg*d2PdT2_T
+    num_g = -Hubble_T*A-delta_rho_nu
+    dden_g_dTg = 12.*rho_g_T/Tg**2+d2rho_e_dT2(Tg)+d2PdT2_T+Tg*d3PdT3(Tg)
+    J_gg = (-dH_dTg*A-Hubble_T*dA_dTg-ddelta_dTg-num_g/den_g*dden_g_dTg)/den_g
+    J_gnu = (-dH_dTnu*A-ddelta_dTnu)/den_g
+    # Neutrinos
+    num_nu = -12.*Hubble_T*rho_nu_T+delta_rho_nu
+    J_nug = (-12.*dH_dTg*rho_nu_T+ddelta_dTg)/den_nu
+    J_nunu = (-12.*(dH_dTnu*rho_nu_T+Hubble_T*den_nu/3.)+ddelta_dTnu-num_nu/den_nu*3.*den_nu/Tnu)/den_nu
+    return [[J_gg,J_gnu],[J_nug,J_nunu]]
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+# MT-era cost and final abundances vs the NSE start temperature T_NSE (PRyM_init).
+# Run from the repository root: python benchmarks/bench_T_NSE.py
+import sys
+import time
+sys.path.insert(0,".")
+
+import PRyM.PRyM_init as PRyMini
+PRyMini.verbose_flag = False
+import PRyM.PRyM_main as PRyMmain
+
+# Record the MT solve of the nuclear network (first BDF call on Y_prime/Y_prime_MT)
+solve_ivp = PRyMmain.solve_ivp
+MT_stats = []
+def solve_ivp_MT(fun,t_span,y0,**kwargs):
+    start_time = time.time()
+    sol = solve_ivp(fun,t_span,y0,**kwargs)
+    if(fun.__name__ in ["Y_prime","Y_prime_MT"] and len(MT_stats) == 0):
+        MT_stats.append((len(sol.t),sol.nfev,sol.njev,time.time()-start_time))
+    return sol
+PRyMmain.solve_ivp = solve_ivp_MT
+
+T_weak_MeV = PRyMini.T_weak/PRyMini.MeV_to_Kelvin
+print(" T_NSE [MeV]  steps  nfev  njev  MT time [s]  YP (CMB)    D/H x 10^5  Li7/H x 10^10")
+for smallnet, T_NSE_list in [(False,[T_weak_MeV,0.8,0.5]),(True,[T_weak_MeV,0.8,0.5,0.3])]:
+    PRyMini.smallnet_flag = smallnet
+    print(" 12 reactions:" if smallnet else " 63 reactions:")
+    for T_NSE in T_NSE_list:
+        PRyMini.T_NSE = T_NSE*PRyMini.MeV_to_Kelvin
+        del MT_stats[:]
+        res = PRyMmain.PRyMclass().PRyMresults()
+        steps, nfev, njev, MT_time = MT_stats[0]
+        print(" %-11.2f  %5d  %4d  %4d  %11.3f  %.8f  %.6f    %.5f" % (T_NSE,steps,nfev,njev,MT_time,res[3],res[5],res[7]))
+PRyMini.T_NSE = PRyMini.T_weak
@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+# Run from the repository root (PRyM_init.working_dir is the current directory): python -m pytest tests
+import warnings
+import numpy as np
+import pytest
+import PRyM.PRyM_background as PRyMbckg
+
+def T_of_t(t):
+    # Radiation-like Tg, Tnu ~ t^(-1/2) with a small wiggle in Tg [MeV]
+    return np.array([(1.+1.e-4*np.sin(50.*np.log(t)))/np.sqrt(t),1./np.sqrt(t)])
+
+def test_adaptive_within_tol():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        bckg = PRyMbckg.Background.Adaptive(T_of_t,1.,10.,1.e-7)
+    assert bckg.tol <= 1.e-7
+
+def test_adaptive_warns_above_tol():
+    with pytest.warns(UserWarning,match="above tolerance"):
+        bckg = PRyMbckg.Background.Adaptive(T_of_t,1.,10.,1.e-14,max_iter=3)
+    assert bckg.tol > 1.e-14
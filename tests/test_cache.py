@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+# Run from the repository root (PRyM_init.working_dir is the current directory): python -m pytest tests
+import os
+import PRyM.PRyM_init as PRyMini
+import PRyM.PRyM_thermo as PRyMthermo
+import PRyM.PRyM_cache as PRyMcache
+
+def test_key_ignores_saved_background(tmp_path,monkeypatch):
+    # Tgamma_Tnu.txt is rewritten by every run with save_bckg_flag: not an input of the key
+    key = PRyMcache.BackgroundKey(PRyMthermo)
+    out_file = PRyMcache.thermo_dir+"Tgamma_Tnu.txt"
+    existed = os.path.isfile(out_file)
+    if existed:
+        os.replace(out_file,str(tmp_path/"Tgamma_Tnu.txt"))
+    try:
+        with open(out_file,"w") as f:
+            f.write("0. 1. 1.\n")
+        assert PRyMcache.BackgroundKey(PRyMthermo) == key
+    finally:
+        os.remove(out_file)
+        if existed:
+            os.replace(str(tmp_path/"Tgamma_Tnu.txt"),out_file)
+
+def test_key_depends_on_Tstart_NP(monkeypatch):
+    monkeypatch.setattr(PRyMini,"Tstart_NP",1.,raising=False)
+    key = PRyMcache.BackgroundKey(PRyMthermo)
+    monkeypatch.setattr(PRyMini,"Tstart_NP",2.)
+    assert PRyMcache.BackgroundKey(PRyMthermo) != key
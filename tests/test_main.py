@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# Run from the repository root (PRyM_init.working_dir is the current directory): python -m pytest tests
+import numpy as np
+import PRyM.PRyM_init as PRyMini
+import PRyM.PRyM_main as PRyMmain
+
+def test_steady_LT_stop_matches_full_integration(monkeypatch):
+    # 12-reaction network: steady state reached well before T_end
+    monkeypatch.setattr(PRyMini,"smallnet_flag",True)
+    monkeypatch.setattr(PRyMini,"verbose_flag",False)
+    # The LT solve is the last solve_ivp call of a run
+    solve_ivp = PRyMmain.solve_ivp
+    sols = []
+    def solve_ivp_keep(*args,**kwargs):
+        sols.append(solve_ivp(*args,**kwargs))
+        return sols[-1]
+    monkeypatch.setattr(PRyMmain,"solve_ivp",solve_ivp_keep)
+    res = {}
+    for steady in [False,True]:
+        monkeypatch.setattr(PRyMini,"steady_LT_flag",steady)
+        res[steady] = (PRyMmain.PRyMclass().PRyMresults(),sols[-1])
+    (res_full, sol_full), (res_steady, sol_steady) = res[False], res[True]
+    # Event fired, well before the end of the LT era
+    assert sol_steady.status == 1 and sol_steady.t[-1] < 0.9*sol_full.t[-1]
+    # Abundances at the stop within the LT tolerances (rtol = 1e-3, atol = 1e-11) of the full solve at T_end
+    Y_full = sol_full.y[:,-1]
+    assert np.all(np.abs(sol_steady.y[:,-1]-Y_full) < 1.e-11+1.e-3*np.abs(Y_full))
+    # Final YP, D/H, He3/H, Li7/H (n decay extrapolated) to steady_LT_frac x rtol
+    assert np.allclose(res_steady[3:],res_full[3:],rtol=PRyMini.steady_LT_frac*1.e-3,atol=0.)
+
+def test_default_within_LT_tolerance_of_converged(monkeypatch):
+    # Converged reference: 63 reactions, LT solve at rtol = 1e-10, atol = 1e-18, other settings default
+    YP_ref, DoH_ref, He3oH_ref, Li7oH_ref = 0.2455648301, 2.45986425, 1.04194651, 5.4293906
+    monkeypatch.setattr(PRyMini,"verbose_flag",False)
+    res = PRyMmain.PRyMclass().PRyMresults()
+    # The default LT solve (rtol = 1e-3) moves D/H, He3/H, Li7/H by up to ~2e-3 under 1e-6 changes of its inputs
+    assert abs(res[3]/YP_ref-1.) < 1.e-5
+    assert np.allclose(res[5:],[DoH_ref,He3oH_ref,Li7oH_ref],rtol=2.5e-3,atol=0.)
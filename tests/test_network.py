@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+# Run from the repository root (PRyM_init.working_dir is the current directory): python -m pytest tests
+import numpy as np
+import pytest
+import PRyM.PRyM_init as PRyMini
+import PRyM.PRyM_nuclear_network as PRyMnetwork
+import PRyM.PRyM_nuclear_net12 as PRyMnet12
+import PRyM.PRyM_nuclear_net63 as PRyMnet63
+
+# Temperatures [K] of MT and LT eras, baryon density [g/cm^3], n <--> p rates [1/s]
+T_test = [3.e9,1.e9,3.e8,1.e8,1.e7]
+rhoB_test, wf_test, wb_test = 1.e-5, 2.e-2, 1.e-3
+
+def Abundances(n,seed):
+    # Positive abundances spread over the range met during BBN
+    return 10.**np.random.default_rng(seed).uniform(-14.,0.,n)
+
+def GrossRates(network,Y,state):
+    # Sum of |terms| entering dY_k/dt, scale of round-off errors for species k
+    f, b = network.Rates(state)
+    Y1 = np.append(Y,1.)
+    flux = np.abs(f*np.prod(Y1[network.lhs],axis=1))+np.abs(b*np.prod(Y1[network.rhs],axis=1))
+    return np.bincount(network.stoich_species,weights=np.abs(network.stoich_coeff)*flux[network.stoich_reaction],minlength=network.n)
+
+def Compare(network,dYdt,Jacobian,rates,seed):
+    for T in T_test:
+        state = (T,rhoB_test,wf_test,wb_test)+rates.Rates(T)
+        Y = Abundances(network.n,seed)
+        scale = GrossRates(network,Y,state)
+        assert np.all(np.abs(network.dYdt(Y,state)-dYdt(Y,state)) <= 1.e-12*scale)
+        # Jacobian by columns: scale of d(dY_k/dt)/dY_c from the same gross rates
+        jac_scale = scale[:,None]/Y[None,:]
+        assert np.all(np.abs(network.Jacobian(Y,state)-Jacobian(Y,state)) <= 1.e-12*jac_scale)
+        if(PRyMini.numba_flag):
+            compiled = PRyMnetwork.CompiledNetwork(network)
+            assert np.all(np.abs(compiled.dYdt(Y,state)-dYdt(Y,state)) <= 1.e-12*scale)
+            assert np.all(np.abs(compiled.Jacobian(Y,state)-Jacobian(Y,state)) <= 1.e-12*jac_scale)
+
+@pytest.mark.parametrize("seed",[0,1,2])
+def test_net12(seed):
+    rates = PRyMnet12.UpdateNuclearRates()
+    Compare(rates.network,rates.dYdt,rates.Jacobian,rates,seed)
+
+@pytest.mark.parametrize("seed",[0,1,2])
+def test_net63(seed):
+    rates = PRyMnet63.UpdateNuclearRates()
+    Compare(rates.networkMT,rates.dYdtMT,rates.JacobianMT,rates,seed)
+    Compare(rates.networkLT,rates.dYdtLT,rates.JacobianLT,rates,seed)
@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+# Run from the repository root (PRyM_init.working_dir is the current directory): python -m pytest tests
+import numpy as np
+import PRyM.PRyM_init as PRyMini
+import PRyM.PRyM_nuclear_rates as PRyMnucl
+
+def test_rate_setup_shared():
+    # Same tables: stacked arrays built once and shared by all constructions
+    rates_1, rates_2 = PRyMnucl.NuclearRates(), PRyMnucl.NuclearRates()
+    assert rates_1.T9_grid is rates_2.T9_grid
+    names = PRyMnucl.reaction_names
+    assert PRyMnucl.RateDatabase(names) is PRyMnucl.RateDatabase(names)
+
+def test_rate_setup_rebuilt_on_new_table(monkeypatch):
+    names = PRyMnucl.reaction_names
+    db = PRyMnucl.RateDatabase(names)
+    # Key rate set by hand in PRyM_init
+    monkeypatch.setattr(PRyMini,"npdg_median",2.*np.asarray(PRyMini.npdg_median),raising=False)
+    db_new = PRyMnucl.RateDatabase(names)
+    assert db_new is not db
+    assert np.allclose(db_new["median"][0],2.*db["median"][0])
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+# Run from the repository root (PRyM_init.working_dir is the current directory): python -m pytest tests
+import os
+import numpy as np
+import PRyM.PRyM_init as PRyMini
+import PRyM.PRyM_tables as PRyMtables
+
+def test_binary_rebuilt_on_source_change(tmp_path,monkeypatch):
+    monkeypatch.setattr(PRyMini,"binary_tables_flag",True)
+    monkeypatch.setattr(PRyMini,"mmap_tables_flag",False)
+    # Count text reads
+    loadtxt_calls = []
+    loadtxt = np.loadtxt
+    def loadtxt_count(*args,**kwargs):
+        loadtxt_calls.append(args[0])
+        return loadtxt(*args,**kwargs)
+    monkeypatch.setattr(np,"loadtxt",loadtxt_count)
+    txt_file = str(tmp_path/"PRyMrates"/"thermo"/"table.txt")
+    os.makedirs(os.path.dirname(txt_file))
+    with open(txt_file,"w") as f:
+        f.write("1. 2.\n3. 4.\n")
+    npy_file = PRyMtables.BinaryPath(txt_file)
+    assert npy_file == str(tmp_path/"PRyMrates"/"bin"/"thermo"/"table.npy")
+    # First call converts
+    assert np.array_equal(PRyMtables.LoadTable(txt_file),[[1.,2.],[3.,4.]])
+    assert os.path.isfile(npy_file) and len(loadtxt_calls) == 1
+    # Unchanged source: binary copy reused
+    assert np.array_equal(PRyMtables.LoadTable(txt_file,unpack=True),[[1.,3.],[2.,4.]])
+    assert len(loadtxt_calls) == 1
+    # Size changed
+    with open(txt_file,"w") as f:
+        f.write("1. 2.\n3. 4.\n5. 6.\n")
+    assert np.array_equal(PRyMtables.LoadTable(txt_file),[[1.,2.],[3.,4.],[5.,6.]])
+    assert len(loadtxt_calls) == 2
+    # Same size, modification time changed
+    txt_stat = os.stat(txt_file)
+    with open(txt_file,"w") as f:
+        f.write("7. 8.\n3. 4.\n5. 6.\n")
+    os.utime(txt_file,ns=(txt_stat.st_atime_ns,txt_stat.st_mtime_ns+10**9))
+    assert os.stat(txt_file).st_size == txt_stat.st_size
+    assert np.array_equal(PRyMtables.LoadTable(txt_file),[[7.,8.],[3.,4.],[5.,6.]])
+    assert len(loadtxt_calls) == 3
+    # And reused again afterwards
+    PRyMtables.LoadTable(txt_file)
+    assert len(loadtxt_calls) == 3
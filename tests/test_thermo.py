@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+# Run from the repository root (PRyM_init.working_dir is the current directory): python -m pytest tests
+import numpy as np
+import pytest
+import PRyM.PRyM_init as PRyMini
+import PRyM.PRyM_thermo as PRyMthermo
+
+# Temperatures [MeV] covered by the background: T_end --> T_start
+T_vec = np.geomspace(PRyMini.T_end/PRyMini.MeV_to_Kelvin,PRyMini.T_start/PRyMini.MeV_to_Kelvin,400)
+
+def test_dspl_dT_finite_difference():
+    # Closed-form dspl/dT against the central difference used for dsbardT in PRyM_main (dToT = 1e-3)
+    dToT = 1.e-3
+    dspl_fd = (PRyMthermo.spl_vec((1.+dToT)*T_vec)-PRyMthermo.spl_vec((1.-dToT)*T_vec))/(2.*dToT*T_vec)
+    assert np.max(np.abs(PRyMthermo.dspl_dT_vec(T_vec)/dspl_fd-1.)) < 1.e-5
+
+def test_dspl_dT_scalar_vector():
+    dspl_scalar = np.array([PRyMthermo.dspl_dT(T) for T in T_vec])
+    assert np.allclose(dspl_scalar,PRyMthermo.dspl_dT_vec(T_vec),rtol=1.e-10,atol=0.)
+
+# x = me/Tg halfway between EOS table knots (worst case for the spline), across [x_EOS_min, x_EOS_max]
+x_EOS_test = np.exp(PRyMthermo.lnx_EOS_0+(np.linspace(0,PRyMthermo.n_EOS-2,25).astype(int)+0.5)*PRyMthermo.dlnx_EOS)
+
+@pytest.mark.parametrize("x",x_EOS_test)
+def test_eos_table_and_vec_vs_quad(x):
+    Tg = PRyMini.me/x
+    quad_res = np.array([PRyMthermo.rho_e_quad(Tg),PRyMthermo.p_e_quad(Tg),PRyMthermo.drho_e_dT_quad(Tg)])
+    quad_res = np.append(quad_res,(quad_res[0]+quad_res[1])/Tg)
+    tab_res = np.array([PRyMthermo.rho_e(Tg),PRyMthermo.p_e(Tg),PRyMthermo.drho_e_dT(Tg),PRyMthermo.s_e(Tg)])
+    vec_res = np.array([PRyMthermo.rho_e_vec(Tg),PRyMthermo.p_e_vec(Tg),PRyMthermo.drho_e_dT_vec(Tg),PRyMthermo.s_e_vec(Tg)])
+    # quad (epsabs=1e-12) loses relative accuracy as the integrals drop to ~1e-12 close to x = 30
+    rtol = 1.e-9 if x < 20. else 1.e-6
+    assert np.allclose(tab_res,quad_res,rtol=rtol,atol=0.)
+    assert np.allclose(vec_res,quad_res,rtol=rtol,atol=0.)
+    # Table against the Gauss-Legendre integrals it is built from, on the whole range
+    assert np.allclose(tab_res,vec_res,rtol=1.e-9,atol=0.)
+
+def test_eos_outside_table():
+    kernel_args = (PRyMthermo.BackgroundConsts(),PRyMthermo.EOS_coeffs,PRyMthermo.lnx_EOS_0,PRyMthermo.dlnx_EOS,
+                   PRyMthermo.QED_interp.args,PRyMthermo.fnu_interp.args)
+    # x < x_EOS_min: scalar functions fall back to quad, compiled kernel refuses
+    Tg = PRyMini.me/(0.5*PRyMthermo.x_EOS_min)
+    assert PRyMthermo.rho_e(Tg) == PRyMthermo.rho_e_quad(Tg)
+    assert PRyMthermo.drho_e_dT(Tg) == PRyMthermo.drho_e_dT_quad(Tg)
+    with pytest.raises(ValueError):
+        PRyMthermo.dTdt_SM_kernel(Tg,Tg,*kernel_args)
+    # x > x_EOS_max: e+- switched off everywhere
+    Tg = PRyMini.me/(1.01*PRyMthermo.x_EOS_max)
+    assert PRyMthermo.rho_e(Tg) == PRyMthermo.rho_e_vec(Tg) == PRyMthermo.rho_e_quad(Tg) == 0.
+    assert PRyMthermo.drho_e_dT(Tg) == PRyMthermo.drho_e_dT_vec(Tg) == PRyMthermo.drho_e_dT_quad(Tg) == 0.
+
+def test_dTdt_SM_jac_finite_difference():
+    # Analytic Jacobian used by the BDF background solve against central differences of the kernel
+    kernel_args = (PRyMthermo.BackgroundConsts(),PRyMthermo.EOS_coeffs,PRyMthermo.lnx_EOS_0,PRyMthermo.dlnx_EOS,
+                   PRyMthermo.QED_interp.args,PRyMthermo.fnu_interp.args)
+    dToT = 1.e-4
+    for Tg in np.geomspace(9.,2.e-3,40):
+        # Tnu/Tg from 1 (decoupling) to ~(11/4)^(1/3) (after e+- annihilation)
+        Tnu = Tg*(1.+0.4/(1.+(Tg/0.1)**2))
+        J = np.array(PRyMthermo.dTdt_SM_jac(Tg,Tnu))
+        J_fd = np.zeros((2,2))
+        for j, T in enumerate([Tg,Tnu]):
+            dT = dToT*T
+            T_p, T_m = np.array([Tg,Tnu]), np.array([Tg,Tnu])
+            T_p[j] += dT
+            T_m[j] -= dT
+            J_fd[:,j] = (np.array(PRyMthermo.dTdt_SM_kernel(*T_p,*kernel_args))-np.array(PRyMthermo.dTdt_SM_kernel(*T_m,*kernel_args)))/(2.*dT)
+        # Relative to the largest entry of each row
+        assert np.all(np.abs(J-J_fd) < 1.e-5*np.max(np.abs(J_fd),axis=1)[:,None])